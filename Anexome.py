@@ -4,7 +4,23 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+import threading
 import random
+import json
+import logging
+import logging.handlers
+import os
+
+import anexome_charts
+import anexome_data
+import anexome_forecast
+import anexome_scorecards
+import anexome_search
+import anexome_tenants
+
+logger = logging.getLogger(__name__)
 
 # Page configuration
 st.set_page_config(
@@ -54,98 +70,509 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Sample data generation (simulating real data sources)
+# Data loading (tables and queries live in anexome_data)
+@st.cache_resource
+def start_data_loads():
+    """Start loading every table and aggregation in parallel, returning a future per name"""
+    executor = ThreadPoolExecutor(
+        max_workers=len(anexome_data.TABLE_LOADERS) + len(anexome_data.TABLE_AGGREGATIONS),
+        thread_name_prefix="anexome-loader"
+    )
+    futures = {name: executor.submit(loader) for name, loader in anexome_data.TABLE_LOADERS.items()}
+    for name, (table, aggregate) in anexome_data.TABLE_AGGREGATIONS.items():
+        futures[name] = executor.submit(lambda source=futures[table], fn=aggregate: fn(source.result()))
+    # Workers exit once the submitted loads finish
+    executor.shutdown(wait=False)
+    return futures
+
+def load_table(name):
+    """Wait for one table or aggregation; results are shared across sessions, so don't mutate them"""
+    future = start_data_loads()[name]
+    if future.exception() is not None:
+        # Retry the loads on the next rerun instead of caching the failure
+        start_data_loads.clear()
+    return future.result()
+
+# Start loading data; each section waits only for the tables it uses
+start_data_loads()
+
+@st.cache_resource
+def get_search_index():
+    """Build the art form, hidden gem and festival search index once"""
+    return anexome_search.SearchIndex.from_tables(
+        {table: load_table(table) for table in anexome_search.SEARCH_FIELDS})
+
+@st.cache_resource
+def get_key_index():
+    """Build the State/Region index across art forms, hidden gems and festivals once"""
+    return anexome_data.build_key_index({table: load_table(table) for table in anexome_data.KEYED_TABLES})
+
+# Region and state scorecards are materialized from district data; set ANEXOME_DISTRICTS
+# to a district CSV and edits to it update only the regions and states they touch
+DISTRICTS_PATH = os.environ.get("ANEXOME_DISTRICTS")
+
+@st.cache_resource
+def get_scorecards():
+    """Materialize the region and state scorecards once per server process"""
+    return anexome_scorecards.Scorecards(load_table('districts'))
+
+@st.cache_resource
+def district_file_state():
+    """Last seen modification time of the district file, and why it couldn't be applied"""
+    return {'mtime': None, 'error': None, 'lock': threading.Lock()}
+
+def apply_district_file():
+    """Apply any change to the district file to the scorecards; returns the error if it couldn't be"""
+    if not DISTRICTS_PATH:
+        return None
+    state = district_file_state()
+    try:
+        mtime = os.stat(DISTRICTS_PATH).st_mtime_ns
+    except OSError:
+        return state['error']
+    with state['lock']:
+        if mtime != state['mtime']:
+            # Record the version either way, so a bad file is read once rather than on every rerun
+            state['mtime'] = mtime
+            try:
+                get_scorecards().refresh(anexome_data.load_districts(DISTRICTS_PATH))
+                state['error'] = None
+            except (OSError, ValueError, KeyError) as error:
+                state['error'] = str(error)
+    return state['error']
+
+def refresh_scorecards():
+    """Apply any change to the district file to the scorecards and return them"""
+    error = apply_district_file()
+    if error:
+        st.warning(f"⚠️ Couldn't apply the district file, showing the last valid scorecards: {error}")
+    return get_scorecards()
+
+# Tenants (?tenant=<name>) see their own edits layered over the shared dataset
+TENANT_DIR = os.environ.get("ANEXOME_TENANT_DIR")
+
+@st.cache_resource
+def get_overlay(tenant):
+    """Load a tenant's delta tables once; the shared base tables are never copied"""
+    return anexome_tenants.load_overlay(TENANT_DIR, tenant)
+
+def overlay_tenant(tenant, table):
+    """Tenant to key a table's caches by: None unless the tenant edited that table"""
+    if tenant is None or table not in get_overlay(tenant):
+        return None
+    return tenant
+
+@st.cache_resource
+def get_tenant_search_index(tenant):
+    """Search index over a tenant's own added and replaced rows"""
+    return anexome_search.SearchIndex.from_tables(
+        {table: delta[~delta['Hidden']] for table, delta in get_overlay(tenant).items()})
+
+def section_options(tenant, table, options_name, options_fn):
+    """Filter values for a section, including values only the tenant's edits use"""
+    delta = get_overlay(tenant).get(table) if tenant is not None else None
+    if delta is None:
+        return load_table(options_name)
+    return anexome_tenants.merge_options(load_table(options_name), options_fn(delta[~delta['Hidden']]))
+
+# Section queries (cached per filter combination); tenant results reuse the cached base result
 @st.cache_data
-def load_cultural_data():
-    """Load and process cultural heritage data"""
-    
-    # Traditional Art Forms Data
-    art_forms = pd.DataFrame({
-        'Art_Form': ['Bharatanatyam', 'Kathak', 'Kuchipudi', 'Odissi', 'Manipuri', 
-                     'Mohiniyattam', 'Sattriya', 'Kathakali', 'Yakshagana', 'Chhau',
-                     'Bhangra', 'Garba', 'Lavani', 'Bihu', 'Giddha'],
-        'State': ['Tamil Nadu', 'Uttar Pradesh', 'Andhra Pradesh', 'Odisha', 'Manipur',
-                 'Kerala', 'Assam', 'Kerala', 'Karnataka', 'West Bengal',
-                 'Punjab', 'Gujarat', 'Maharashtra', 'Assam', 'Punjab'],
-        'Region': ['South', 'North', 'South', 'East', 'Northeast', 
-                  'South', 'Northeast', 'South', 'South', 'East',
-                  'North', 'West', 'West', 'Northeast', 'North'],
-        'Category': ['Classical Dance', 'Classical Dance', 'Classical Dance', 'Classical Dance', 'Classical Dance',
-                    'Classical Dance', 'Classical Dance', 'Classical Dance', 'Theatre', 'Dance Drama',
-                    'Folk Dance', 'Folk Dance', 'Folk Dance', 'Folk Dance', 'Folk Dance'],
-        'Practitioners': [15000, 25000, 8000, 6000, 3000, 4000, 2000, 5000, 3500, 4500,
-                         12000, 18000, 9000, 7000, 8500],
-        'Tourist_Interest': [85, 78, 72, 68, 45, 65, 35, 88, 42, 58,
-                           70, 75, 62, 48, 55],
-        'Preservation_Status': ['High', 'High', 'Medium', 'Medium', 'Low', 'Medium', 'Low', 'High', 'Low', 'Medium',
-                               'High', 'High', 'Medium', 'Medium', 'Medium'],
-        'UNESCO_Recognition': ['Yes', 'Yes', 'No', 'No', 'No', 'No', 'Yes', 'Yes', 'No', 'No',
-                              'No', 'No', 'No', 'No', 'No'],
-        'Age_Group': ['500+ years', '400+ years', '300+ years', '200+ years', '300+ years',
-                     '400+ years', '500+ years', '600+ years', '400+ years', '300+ years',
-                     '300+ years', '500+ years', '200+ years', '400+ years', '300+ years']
-    })
-    
-    # Tourism data by month
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    tourism_data = pd.DataFrame({
-        'Month': months,
-        'Cultural_Tourists': [120000, 150000, 200000, 180000, 160000, 140000,
-                             130000, 145000, 175000, 220000, 250000, 200000],
-        'Art_Festival_Events': [15, 18, 25, 22, 20, 18, 16, 19, 23, 28, 35, 25],
-        'Revenue_Crores': [45, 58, 78, 72, 65, 55, 52, 58, 70, 88, 95, 80],
-        'International_Visitors': [8000, 12000, 18000, 15000, 12000, 9000,
-                                  8500, 11000, 14000, 22000, 28000, 18000],
-        'Domestic_Visitors': [112000, 138000, 182000, 165000, 148000, 131000,
-                             121500, 134000, 161000, 198000, 222000, 182000]
-    })
-    
-    # Regional distribution
-    regional_data = pd.DataFrame({
-        'Region': ['North', 'South', 'East', 'West', 'Northeast', 'Central'],
-        'Art_Forms_Count': [25, 35, 18, 22, 12, 15],
-        'Tourist_Footfall': [450000, 680000, 320000, 520000, 180000, 280000],
-        'Infrastructure_Score': [7.8, 8.5, 6.2, 8.0, 5.5, 6.8],
-        'Digitization_Level': [65, 78, 45, 70, 35, 55],
-        'Investment_Crores': [125, 180, 85, 140, 45, 95]
-    })
-    
-    # Hidden gems data
-    hidden_gems = pd.DataFrame({
-        'Location': ['Mithila (Bihar)', 'Warli (Maharashtra)', 'Pattachitra (Odisha)', 
-                     'Phad (Rajasthan)', 'Kalamkari (Andhra Pradesh)', 'Tanjore (Tamil Nadu)',
-                     'Gond (Madhya Pradesh)', 'Pichwai (Rajasthan)', 'Madhubani (Bihar)',
-                     'Cheriyal (Telangana)'],
-        'Art_Type': ['Painting', 'Tribal Art', 'Scroll Painting', 'Narrative Painting',
-                    'Hand Painting', 'Classical Painting', 'Contemporary Tribal', 'Temple Art',
-                    'Folk Painting', 'Scroll Painting'],
-        'Accessibility_Score': [3.2, 4.1, 5.8, 6.2, 7.1, 8.5, 2.8, 7.8, 4.5, 5.2],
-        'Tourist_Awareness': [25, 35, 45, 55, 65, 85, 20, 70, 30, 40],
-        'Preservation_Urgency': ['High', 'High', 'Medium', 'Medium', 'Low', 'Low', 'Critical', 'Medium', 'High', 'Medium'],
-        'Annual_Visitors': [5000, 8000, 15000, 25000, 35000, 75000, 3000, 45000, 7000, 12000],
-        'State': ['Bihar', 'Maharashtra', 'Odisha', 'Rajasthan', 'Andhra Pradesh', 'Tamil Nadu',
-                 'Madhya Pradesh', 'Rajasthan', 'Bihar', 'Telangana']
-    })
-    
-    # Festival calendar data
-    festivals_df = pd.DataFrame({
-        'Festival': ['Khajuraho Dance Festival', 'Konark Dance Festival', 'Mamallapuram Dance Festival',
-                    'Hampi Festival', 'Rajasthan Folk Festival', 'Kerala Kathakali Festival',
-                    'Manipur Sangai Festival', 'Assam Tea Festival', 'Gujarat Navratri',
-                    'Punjab Baisakhi Festival'],
-        'Month': ['Feb', 'Dec', 'Jan', 'Nov', 'Oct', 'Aug', 'Nov', 'Nov', 'Oct', 'Apr'],
-        'Duration_Days': [7, 5, 4, 3, 10, 6, 10, 5, 9, 3],
-        'Expected_Visitors': [50000, 35000, 25000, 40000, 75000, 20000, 30000, 15000, 200000, 100000],
-        'State': ['Madhya Pradesh', 'Odisha', 'Tamil Nadu', 'Karnataka', 'Rajasthan', 'Kerala',
-                 'Manipur', 'Assam', 'Gujarat', 'Punjab']
-    })
-    
-    return art_forms, tourism_data, regional_data, hidden_gems, festivals_df
+def filter_art_forms(tenant, region, category, preservation, unesco, state, age_group):
+    """Filter art forms by the Art Forms section selections"""
+    if tenant is None:
+        return anexome_data.filter_art_forms(load_table('art_forms'), region, category, preservation,
+                                             unesco, state, age_group)
+    return anexome_tenants.apply_overlay(
+        filter_art_forms(None, region, category, preservation, unesco, state, age_group),
+        get_overlay(tenant).get('art_forms'), 'art_forms', anexome_data.filter_art_forms,
+        dict(region=region, category=category, preservation=preservation,
+             unesco=unesco, state=state, age_group=age_group)
+    )
+
+@st.cache_data
+def filter_hidden_gems(tenant, urgency, art_type, state, accessibility_range, awareness_range):
+    """Filter hidden gems by the Hidden Gems section selections"""
+    if tenant is None:
+        return anexome_data.filter_hidden_gems(load_table('hidden_gems'), urgency, art_type, state,
+                                               accessibility_range, awareness_range)
+    return anexome_tenants.apply_overlay(
+        filter_hidden_gems(None, urgency, art_type, state, accessibility_range, awareness_range),
+        get_overlay(tenant).get('hidden_gems'), 'hidden_gems', anexome_data.filter_hidden_gems,
+        dict(urgency=urgency, art_type=art_type, state=state,
+             accessibility_range=accessibility_range, awareness_range=awareness_range)
+    )
+
+@st.cache_data
+def filter_festivals(tenant, month, state, visitor_range):
+    """Filter festivals by the Festival Calendar section selections"""
+    if tenant is None:
+        return anexome_data.filter_festivals(load_table('festivals'), month, state, visitor_range)
+    return anexome_tenants.apply_overlay(
+        filter_festivals(None, month, state, visitor_range),
+        get_overlay(tenant).get('festivals'), 'festivals', anexome_data.filter_festivals,
+        dict(month=month, state=state, visitor_range=visitor_range)
+    )
+
+# Next-year forecasts drawn on the Tourism Analytics charts
+TOURISM_FORECAST_COLUMNS = ['Cultural_Tourists', 'Domestic_Visitors', 'International_Visitors', 'Revenue_Crores']
+
+@st.cache_data
+def tourism_forecasts(version):
+    """Forecast the monthly tourism series; cached per tourism data version"""
+    return anexome_forecast.forecast_columns(load_table('tourism'), TOURISM_FORECAST_COLUMNS)
+
+def add_forecast_band(fig, forecast, months, color, fillcolor):
+    """Draw a forecast line with its 95% band after the observed months"""
+    x = [f"{months[(len(months) + step - 1) % len(months)]} (forecast)" for step in forecast['Step']]
+    fig.add_trace(go.Scatter(
+        x=x, y=forecast['Upper'], mode='lines', line=dict(width=0),
+        showlegend=False, hoverinfo='skip'
+    ))
+    fig.add_trace(go.Scatter(
+        x=x, y=forecast['Lower'].clip(lower=0), mode='lines', line=dict(width=0),
+        fill='tonexty', fillcolor=fillcolor, name='95% range'
+    ))
+    fig.add_trace(go.Scatter(
+        x=x, y=forecast['Forecast'], mode='lines', line=dict(color=color, dash='dash'),
+        name='Forecast'
+    ))
+
+# Section figures (cached per filter combination)
+@st.cache_data
+def regional_figures(scorecard_version):
+    """Build the Overview and Tourism Analytics regional charts; cached per scorecard version"""
+    regional_df = get_scorecards().table('Region')
+    fig_regional = px.pie(
+        regional_df,
+        values='Art_Forms_Count',
+        names='Region',
+        title="Art Forms by Region",
+        color_discrete_sequence=['#81C784', '#64B5F6', '#FFB74D', '#F06292', '#BA68C8', '#4DB6AC']
+    )
+    fig_regional.update_layout(height=400)
+
+    fig_footfall = px.bar(
+        regional_df,
+        x='Region',
+        y='Tourist_Footfall',
+        title='Tourist Footfall by Region',
+        color='Infrastructure_Score',
+        color_continuous_scale='Sunset',
+        hover_data=['Investment_Crores']
+    )
+
+    fig_infra = px.scatter(
+        regional_df,
+        x='Infrastructure_Score',
+        y='Digitization_Level',
+        size='Tourist_Footfall',
+        color='Art_Forms_Count',
+        hover_name='Region',
+        title='Infrastructure vs Digitization',
+        color_continuous_scale='Turbo'
+    )
+    return fig_regional, fig_footfall, fig_infra
+
+@st.cache_data
+def art_form_figures(tenant, region, category, preservation, unesco, state, age_group):
+    """Build the Art Forms section charts for a filter combination"""
+    filtered_df = filter_art_forms(tenant, region, category, preservation, unesco, state, age_group)
+    if filtered_df.empty:
+        return None, None, None
+
+    fig_practitioners = px.bar(
+        filtered_df.head(10),
+        x='Art_Form',
+        y='Practitioners',
+        title="Number of Practitioners",
+        color='Practitioners',
+        color_continuous_scale='Viridis',
+        hover_data=['State', 'Category']
+    )
+    fig_practitioners.update_xaxes(tickangle=45)
+
+    fig_interest = px.scatter(
+        filtered_df,
+        x='Practitioners',
+        y='Tourist_Interest',
+        size='Tourist_Interest',
+        color='Preservation_Status',
+        hover_name='Art_Form',
+        title="Tourist Interest vs Practitioners",
+        color_discrete_map={'High': '#4CAF50', 'Medium': '#FF9800', 'Low': '#F44336'}
+    )
+
+    # Category distribution
+    fig_category = None
+    if len(filtered_df['Category'].unique()) > 1:
+        fig_category = px.histogram(
+            filtered_df,
+            x='Category',
+            color='Region',
+            title="Art Forms by Category and Region",
+            barmode='group'
+        )
+    return fig_practitioners, fig_interest, fig_category
+
+@st.cache_data
+def tourism_figures(visitor_type):
+    """Build the Tourism Analytics section charts for a visitor type"""
+    tourism_df = load_table('tourism')
+
+    if visitor_type == "Domestic":
+        fig_seasonal = px.line(
+            tourism_df,
+            x='Month',
+            y='Domestic_Visitors',
+            title='Domestic Tourism Trends',
+            markers=True,
+            line_shape='spline'
+        )
+    elif visitor_type == "International":
+        fig_seasonal = px.line(
+            tourism_df,
+            x='Month',
+            y='International_Visitors',
+            title='International Tourism Trends',
+            markers=True,
+            line_shape='spline'
+        )
+    else:
+        fig_seasonal = px.line(
+            tourism_df,
+            x='Month',
+            y='Cultural_Tourists',
+            title='Total Cultural Tourism Trends',
+            markers=True,
+            line_shape='spline'
+        )
+    fig_seasonal.update_traces(line_color='#FF7043', marker_color='#FF5722')
+
+    # Forecast bands for next year
+    forecasts = tourism_forecasts(load_table('tourism_version'))
+    months = tourism_df['Month'].tolist()
+    seasonal_column = {'Domestic': 'Domestic_Visitors',
+                       'International': 'International_Visitors'}.get(visitor_type, 'Cultural_Tourists')
+    add_forecast_band(fig_seasonal, forecasts[forecasts['Series'] == seasonal_column], months,
+                      '#FF7043', 'rgba(255, 112, 67, 0.2)')
+
+    fig_events = px.bar(
+        tourism_df,
+        x='Month',
+        y='Art_Festival_Events',
+        title='Cultural Events by Month',
+        color='Art_Festival_Events',
+        color_continuous_scale='Plasma'
+    )
+
+    # Revenue analysis
+    fig_revenue = px.area(
+        tourism_df,
+        x='Month',
+        y='Revenue_Crores',
+        title='Monthly Cultural Tourism Revenue (₹ Crores)'
+    )
+    fig_revenue.update_traces(fillcolor='rgba(102, 187, 106, 0.3)', line_color='#4CAF50')
+    add_forecast_band(fig_revenue, forecasts[forecasts['Series'] == 'Revenue_Crores'], months,
+                      '#4CAF50', 'rgba(102, 187, 106, 0.15)')
+    return fig_seasonal, fig_events, fig_revenue
+
+@st.cache_data
+def hidden_gem_figures(tenant, urgency, art_type, state, accessibility_range, awareness_range):
+    """Build the Hidden Gems section chart for a filter combination"""
+    filtered_gems = filter_hidden_gems(tenant, urgency, art_type, state, accessibility_range, awareness_range)
+    if filtered_gems.empty:
+        return None
+
+    fig_gems = px.scatter(
+        filtered_gems,
+        x='Accessibility_Score',
+        y='Tourist_Awareness',
+        size='Annual_Visitors',
+        color='Preservation_Urgency',
+        hover_name='Location',
+        title='Hidden Gems: Accessibility vs Tourist Awareness',
+        color_discrete_map={
+            'Critical': '#FF5722',
+            'High': '#FF9800',
+            'Medium': '#FFC107',
+            'Low': '#4CAF50'
+        }
+    )
+    fig_gems.update_layout(height=500)
+    return fig_gems
+
+@st.cache_data
+def festival_figures(tenant, month, state, visitor_range):
+    """Build the Festival Calendar section charts for a filter combination"""
+    filtered_festivals = filter_festivals(tenant, month, state, visitor_range)
+    if filtered_festivals.empty:
+        return None, None, None
+
+    fig_monthly = px.histogram(
+        filtered_festivals,
+        x='Month',
+        title='Festivals by Month',
+        color_discrete_sequence=['#FF6B6B']
+    )
+
+    fig_visitors = px.scatter(
+        filtered_festivals,
+        x='Duration_Days',
+        y='Expected_Visitors',
+        size='Expected_Visitors',
+        color='State',
+        hover_name='Festival',
+        title='Festival Duration vs Expected Visitors'
+    )
+
+    # Festival calendar view
+    fig_calendar = px.bar(
+        filtered_festivals,
+        x='Festival',
+        y='Expected_Visitors',
+        color='Month',
+        title='Festival Calendar Overview',
+        hover_data=['State', 'Duration_Days']
+    )
+    fig_calendar.update_xaxes(tickangle=45)
+    return fig_monthly, fig_visitors, fig_calendar
+
+# Charts are sent as Plotly JSON, or as compact binary payloads with ANEXOME_BINARY_CHARTS=1 (experimental)
+BINARY_CHARTS = os.environ.get("ANEXOME_BINARY_CHARTS") == "1"
+
+def show_chart(fig):
+    """Draw a chart at container width"""
+    if BINARY_CHARTS:
+        anexome_charts.plotly_chart_binary(fig)
+    else:
+        st.plotly_chart(fig, use_container_width=True)
+
+# Cache warm-up: sections in the order users usually visit them, with default filters
+SECTION_PREFETCH = {
+    # Filled in with the scorecard version current at warm-up
+    "🏠 Overview": (regional_figures, {'scorecard_version': None}),
+    "🎭 Art Forms": (art_form_figures, {
+        'tenant': None, 'region': "All", 'category': "All", 'preservation': "All",
+        'unesco': "All", 'state': "All", 'age_group': "All"
+    }),
+    "📊 Tourism Analytics": (tourism_figures, {'visitor_type': "All"}),
+    "💎 Hidden Gems": (hidden_gem_figures, {
+        'tenant': None, 'urgency': "All", 'art_type': "All", 'state': "All",
+        'accessibility_range': (0.0, 10.0), 'awareness_range': (0, 100)
+    }),
+    "🎪 Festival Calendar": (festival_figures, {
+        'tenant': None, 'month': "All", 'state': "All", 'visitor_range': "All"
+    }),
+}
+
+# Optional JSON-lines log of section filter selections, used to warm common combinations
+ACCESS_LOG_PATH = os.environ.get("ANEXOME_ACCESS_LOG")
+ACCESS_LOG_MAX_BYTES = 1024 * 1024
+PREFETCH_TOP_COMBINATIONS = 20
+PREFETCH_THREAD_PREFIX = "anexome-prefetch"
+
+@st.cache_resource
+def get_access_logger():
+    """Logger writing the access log; rotated to <path>.1 once it reaches ACCESS_LOG_MAX_BYTES"""
+    access_logger = logging.getLogger("anexome.access")
+    access_logger.propagate = False
+    handler = logging.handlers.RotatingFileHandler(
+        ACCESS_LOG_PATH, maxBytes=ACCESS_LOG_MAX_BYTES, backupCount=1, encoding='utf-8')
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    access_logger.addHandler(handler)
+    access_logger.setLevel(logging.INFO)
+    return access_logger
+
+def log_section_access(section, filters):
+    """Log a section's filter selection when it changes, if the access log is enabled"""
+    if not ACCESS_LOG_PATH:
+        return
+    # Reruns from other widgets repeat the same selection; only record new ones
+    logged_filters = st.session_state.setdefault('logged_filters', {})
+    if logged_filters.get(section) == filters:
+        return
+    logged_filters[section] = filters
+    get_access_logger().info(json.dumps({'section': section, 'filters': filters}, ensure_ascii=False))
+
+def common_filter_combinations(path, top_n=PREFETCH_TOP_COMBINATIONS):
+    """Return the most frequent (section, filters) pairs recorded in the access log and its backup"""
+    counts = Counter()
+    for log_path in [path + ".1", path]:
+        try:
+            with open(log_path, encoding='utf-8') as log_file:
+                for line in log_file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if not isinstance(entry, dict) or entry.get('section') not in SECTION_PREFETCH:
+                        continue
+                    filters = entry.get('filters')
+                    # Entries from older versions of a section's filters can't be replayed
+                    if not isinstance(filters, dict) or filters.keys() != SECTION_PREFETCH[entry['section']][1].keys():
+                        continue
+                    # Sliders log tuples as JSON lists; restore them so cache keys match
+                    filters = tuple(
+                        (name, tuple(value) if isinstance(value, list) else value)
+                        for name, value in filters.items()
+                    )
+                    counts[(entry['section'], filters)] += 1
+        except OSError:
+            continue
+    return [(section, dict(filters)) for (section, filters), _ in counts.most_common(top_n)]
 
-# Load data
-art_forms_df, tourism_df, regional_df, hidden_gems_df, festivals_df = load_cultural_data()
+def _skip_prefetch_context_warning(record):
+    """Log filter dropping Streamlit's missing-ScriptRunContext warning for warm-up threads,
+    which call cached functions outside any session on purpose"""
+    return not (record.msg.startswith("Thread '%s': missing ScriptRunContext")
+                and str(record.args[0]).startswith(PREFETCH_THREAD_PREFIX))
+
+@st.cache_resource
+def get_prefetch_executor():
+    """Shared thread pool for background cache warm-up"""
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(
+        _skip_prefetch_context_warning)
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix=PREFETCH_THREAD_PREFIX)
+
+def _warm(section, filters):
+    """Compute a section's data and charts so later reruns hit the cache"""
+    figures_fn = SECTION_PREFETCH[section][0]
+    try:
+        figures_fn(**filters)
+    except Exception:
+        # A failed warm-up only costs the first visit its cache hit, but shouldn't go unnoticed
+        logger.warning("Cache warm-up failed for %s with %s", section, filters, exc_info=True)
+
+@st.cache_resource
+def start_cache_warmup():
+    """Warm default and commonly used filter results once per server process"""
+    executor = get_prefetch_executor()
+    # Regional charts are cached per scorecard version; warm the current one
+    apply_district_file()
+    live_filters = {'scorecard_version': get_scorecards().version}
+    jobs = [(section, {name: live_filters.get(name, value) for name, value in filters.items()})
+            for section, (_, filters) in SECTION_PREFETCH.items()]
+    if ACCESS_LOG_PATH:
+        jobs += common_filter_combinations(ACCESS_LOG_PATH)
+    futures = [executor.submit(_warm, section, filters) for section, filters in jobs]
+    futures.append(executor.submit(get_search_index))
+    futures.append(executor.submit(get_key_index))
+    return futures
+
+# Exports of the current filtered view, reusing the cached query result
+def export_buttons(name, query, filters):
+    """Show CSV/Parquet download buttons; the file is only built when clicked"""
+    cols = st.columns([1, 1, 4])
+    for col, (export_format, (extension, mime)) in zip(cols, anexome_data.EXPORT_FORMATS.items()):
+        with col:
+            st.download_button(
+                f"⬇️ Export {export_format}",
+                data=lambda export_format=export_format: anexome_data.export_bytes(query(**filters), export_format),
+                file_name=f"anexome_{name}.{extension}",
+                mime=mime,
+                on_click="ignore"
+            )
 
 # Header
 st.markdown("""
@@ -161,9 +588,31 @@ st.sidebar.title("🧭 Navigation")
 section = st.sidebar.selectbox(
     "Select Section",
     ["🏠 Overview", "🎭 Art Forms", "📊 Tourism Analytics", 
-     "💎 Hidden Gems", "🌱 Responsible Tourism", "📈 Impact Dashboard", "🎪 Festival Calendar"]
+     "💎 Hidden Gems", "🌱 Responsible Tourism", "📈 Impact Dashboard", "🎪 Festival Calendar",
+     "🗺️ State Explorer"]
 )
 
+# Tenant from the embedding URL, e.g. ?tenant=odisha
+tenant = st.query_params.get("tenant")
+if not TENANT_DIR or not anexome_tenants.valid_tenant(tenant):
+    tenant = None
+elif get_overlay(tenant):
+    st.sidebar.caption(f"Including edits from **{tenant}**")
+
+# Search across art forms, hidden gems and festivals
+SEARCH_LABELS = {'art_forms': "🎭 Art Form", 'hidden_gems': "💎 Hidden Gem", 'festivals': "🎪 Festival"}
+search_query = st.sidebar.text_input("🔎 Search", placeholder="Art form, hidden gem, festival or state")
+if search_query:
+    search_results = get_search_index().search(search_query, limit=8)
+    if tenant is not None and get_overlay(tenant):
+        search_results = anexome_tenants.merge_search_results(
+            search_results, get_tenant_search_index(tenant).search(search_query, limit=8),
+            get_overlay(tenant), limit=8)
+    for result in search_results:
+        st.sidebar.markdown(f"**{result['title']}** · {SEARCH_LABELS[result['table']]} · {result['state']}")
+    if not search_results:
+        st.sidebar.caption("No matches found")
+
 # Global filters in sidebar
 st.sidebar.markdown("---")
 st.sidebar.subheader("🔧 Global Filters")
@@ -241,15 +690,8 @@ if section == "🏠 Overview":
     
     with col2:
         # Regional distribution pie chart
-        fig_regional = px.pie(
-            regional_df, 
-            values='Art_Forms_Count', 
-            names='Region',
-            title="Art Forms by Region",
-            color_discrete_sequence=['#81C784', '#64B5F6', '#FFB74D', '#F06292', '#BA68C8', '#4DB6AC']
-        )
-        fig_regional.update_layout(height=400)
-        st.plotly_chart(fig_regional, use_container_width=True)
+        fig_regional = regional_figures(refresh_scorecards().version)[0]
+        show_chart(fig_regional)
 
 elif section == "🎭 Art Forms":
     st.header("Traditional Art Forms Explorer")
@@ -257,84 +699,53 @@ elif section == "🎭 Art Forms":
     # Enhanced filter section
     st.markdown('<div class="filter-section">', unsafe_allow_html=True)
     st.subheader("🔍 Filters")
+    art_form_choices = section_options(tenant, 'art_forms', 'art_form_options', anexome_data.art_form_options)
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        selected_region = st.selectbox("Region", ["All"] + sorted(art_forms_df['Region'].unique()))
+        selected_region = st.selectbox("Region", ["All"] + art_form_choices['Region'])
     with col2:
-        selected_category = st.selectbox("Category", ["All"] + sorted(art_forms_df['Category'].unique()))
+        selected_category = st.selectbox("Category", ["All"] + art_form_choices['Category'])
     with col3:
-        preservation_filter = st.selectbox("Preservation Status", ["All"] + sorted(art_forms_df['Preservation_Status'].unique()))
+        preservation_filter = st.selectbox("Preservation Status", ["All"] + art_form_choices['Preservation_Status'])
     with col4:
         unesco_filter = st.selectbox("UNESCO Recognition", ["All", "Yes", "No"])
     
     # Additional filters
     col5, col6 = st.columns(2)
     with col5:
-        selected_state = st.selectbox("State", ["All"] + sorted(art_forms_df['State'].unique()))
+        selected_state = st.selectbox("State", ["All"] + art_form_choices['State'])
     with col6:
-        age_group_filter = st.selectbox("Age Group", ["All"] + sorted(art_forms_df['Age_Group'].unique()))
+        age_group_filter = st.selectbox("Age Group", ["All"] + art_form_choices['Age_Group'])
     
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Filter data
-    filtered_df = art_forms_df.copy()
-    if selected_region != "All":
-        filtered_df = filtered_df[filtered_df['Region'] == selected_region]
-    if selected_category != "All":
-        filtered_df = filtered_df[filtered_df['Category'] == selected_category]
-    if preservation_filter != "All":
-        filtered_df = filtered_df[filtered_df['Preservation_Status'] == preservation_filter]
-    if unesco_filter != "All":
-        filtered_df = filtered_df[filtered_df['UNESCO_Recognition'] == unesco_filter]
-    if selected_state != "All":
-        filtered_df = filtered_df[filtered_df['State'] == selected_state]
-    if age_group_filter != "All":
-        filtered_df = filtered_df[filtered_df['Age_Group'] == age_group_filter]
+    art_form_filters = {
+        'tenant': overlay_tenant(tenant, 'art_forms'), 'region': selected_region, 'category': selected_category, 'preservation': preservation_filter,
+        'unesco': unesco_filter, 'state': selected_state, 'age_group': age_group_filter
+    }
+    log_section_access(section, art_form_filters)
+    filtered_df = filter_art_forms(**art_form_filters)
     
     # Display filtered count
     st.info(f"📋 Showing {len(filtered_df)} art forms based on selected filters")
+    export_buttons("art_forms", filter_art_forms, art_form_filters)
     
     # Art forms visualization
     if not filtered_df.empty:
+        fig_practitioners, fig_interest, fig_category = art_form_figures(**art_form_filters)
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_practitioners = px.bar(
-                filtered_df.head(10), 
-                x='Art_Form', 
-                y='Practitioners',
-                title="Number of Practitioners",
-                color='Practitioners',
-                color_continuous_scale='Viridis',
-                hover_data=['State', 'Category']
-            )
-            fig_practitioners.update_xaxes(tickangle=45)
-            st.plotly_chart(fig_practitioners, use_container_width=True)
+            show_chart(fig_practitioners)
         
         with col2:
-            fig_interest = px.scatter(
-                filtered_df,
-                x='Practitioners',
-                y='Tourist_Interest',
-                size='Tourist_Interest',
-                color='Preservation_Status',
-                hover_name='Art_Form',
-                title="Tourist Interest vs Practitioners",
-                color_discrete_map={'High': '#4CAF50', 'Medium': '#FF9800', 'Low': '#F44336'}
-            )
-            st.plotly_chart(fig_interest, use_container_width=True)
+            show_chart(fig_interest)
         
         # Category distribution
-        if len(filtered_df['Category'].unique()) > 1:
-            fig_category = px.histogram(
-                filtered_df,
-                x='Category',
-                color='Region',
-                title="Art Forms by Category and Region",
-                barmode='group'
-            )
-            st.plotly_chart(fig_category, use_container_width=True)
+        if fig_category is not None:
+            show_chart(fig_category)
         
         # Art form details
         st.subheader("📜 Featured Art Forms")
@@ -365,60 +776,21 @@ elif section == "📊 Tourism Analytics":
         comparison_year = st.selectbox("Compare with Year", ["None", "2023", "2022", "2021"])
     st.markdown('</div>', unsafe_allow_html=True)
     
+    log_section_access(section, {'visitor_type': visitor_type})
+    fig_seasonal, fig_events, fig_revenue = tourism_figures(visitor_type)
+    _, fig_footfall, fig_infra = regional_figures(refresh_scorecards().version)
+    
     # Seasonal trends
     col1, col2 = st.columns(2)
     
     with col1:
-        if visitor_type == "Domestic":
-            fig_seasonal = px.line(
-                tourism_df,
-                x='Month',
-                y='Domestic_Visitors',
-                title='Domestic Tourism Trends',
-                markers=True,
-                line_shape='spline'
-            )
-        elif visitor_type == "International":
-            fig_seasonal = px.line(
-                tourism_df,
-                x='Month',
-                y='International_Visitors',
-                title='International Tourism Trends',
-                markers=True,
-                line_shape='spline'
-            )
-        else:
-            fig_seasonal = px.line(
-                tourism_df,
-                x='Month',
-                y='Cultural_Tourists',
-                title='Total Cultural Tourism Trends',
-                markers=True,
-                line_shape='spline'
-            )
-        fig_seasonal.update_traces(line_color='#FF7043', marker_color='#FF5722')
-        st.plotly_chart(fig_seasonal, use_container_width=True)
+        show_chart(fig_seasonal)
     
     with col2:
-        fig_events = px.bar(
-            tourism_df,
-            x='Month',
-            y='Art_Festival_Events',
-            title='Cultural Events by Month',
-            color='Art_Festival_Events',
-            color_continuous_scale='Plasma'
-        )
-        st.plotly_chart(fig_events, use_container_width=True)
+        show_chart(fig_events)
     
     # Revenue analysis
-    fig_revenue = px.area(
-        tourism_df,
-        x='Month',
-        y='Revenue_Crores',
-        title='Monthly Cultural Tourism Revenue (₹ Crores)'
-    )
-    fig_revenue.update_traces(fillcolor='rgba(102, 187, 106, 0.3)', line_color='#4CAF50')
-    st.plotly_chart(fig_revenue, use_container_width=True)
+    show_chart(fig_revenue)
     
     # Regional insights
     st.subheader("🗺️ Regional Performance Insights")
@@ -426,42 +798,24 @@ elif section == "📊 Tourism Analytics":
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_footfall = px.bar(
-            regional_df,
-            x='Region',
-            y='Tourist_Footfall',
-            title='Tourist Footfall by Region',
-            color='Infrastructure_Score',
-            color_continuous_scale='Sunset',
-            hover_data=['Investment_Crores']
-        )
-        st.plotly_chart(fig_footfall, use_container_width=True)
+        show_chart(fig_footfall)
     
     with col2:
-        fig_infra = px.scatter(
-            regional_df,
-            x='Infrastructure_Score',
-            y='Digitization_Level',
-            size='Tourist_Footfall',
-            color='Art_Forms_Count',
-            hover_name='Region',
-            title='Infrastructure vs Digitization',
-            color_continuous_scale='Turbo'
-        )
-        st.plotly_chart(fig_infra, use_container_width=True)
+        show_chart(fig_infra)
 
 elif section == "💎 Hidden Gems":
     st.header("Hidden Cultural Treasures")
+    gem_choices = section_options(tenant, 'hidden_gems', 'hidden_gem_options', anexome_data.hidden_gem_options)
     
     # Filter section
     st.markdown('<div class="filter-section">', unsafe_allow_html=True)
     col1, col2, col3 = st.columns(3)
     with col1:
-        urgency_filter = st.selectbox("Preservation Urgency", ["All"] + sorted(hidden_gems_df['Preservation_Urgency'].unique()))
+        urgency_filter = st.selectbox("Preservation Urgency", ["All"] + gem_choices['Preservation_Urgency'])
     with col2:
-        art_type_filter = st.selectbox("Art Type", ["All"] + sorted(hidden_gems_df['Art_Type'].unique()))
+        art_type_filter = st.selectbox("Art Type", ["All"] + gem_choices['Art_Type'])
     with col3:
-        state_filter = st.selectbox("State", ["All"] + sorted(hidden_gems_df['State'].unique()))
+        state_filter = st.selectbox("State", ["All"] + gem_choices['State'])
     
     col4, col5 = st.columns(2)
     with col4:
@@ -471,42 +825,20 @@ elif section == "💎 Hidden Gems":
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Filter data
-    filtered_gems = hidden_gems_df.copy()
-    if urgency_filter != "All":
-        filtered_gems = filtered_gems[filtered_gems['Preservation_Urgency'] == urgency_filter]
-    if art_type_filter != "All":
-        filtered_gems = filtered_gems[filtered_gems['Art_Type'] == art_type_filter]
-    if state_filter != "All":
-        filtered_gems = filtered_gems[filtered_gems['State'] == state_filter]
-    
-    filtered_gems = filtered_gems[
-        (filtered_gems['Accessibility_Score'] >= accessibility_range[0]) &
-        (filtered_gems['Accessibility_Score'] <= accessibility_range[1]) &
-        (filtered_gems['Tourist_Awareness'] >= awareness_range[0]) &
-        (filtered_gems['Tourist_Awareness'] <= awareness_range[1])
-    ]
+    gem_filters = {
+        'tenant': overlay_tenant(tenant, 'hidden_gems'), 'urgency': urgency_filter, 'art_type': art_type_filter, 'state': state_filter,
+        'accessibility_range': accessibility_range, 'awareness_range': awareness_range
+    }
+    log_section_access(section, gem_filters)
+    filtered_gems = filter_hidden_gems(**gem_filters)
     
     st.info(f"💎 Found {len(filtered_gems)} hidden gems matching your criteria")
+    export_buttons("hidden_gems", filter_hidden_gems, gem_filters)
     
     if not filtered_gems.empty:
         # Accessibility vs Awareness scatter plot
-        fig_gems = px.scatter(
-            filtered_gems,
-            x='Accessibility_Score',
-            y='Tourist_Awareness',
-            size='Annual_Visitors',
-            color='Preservation_Urgency',
-            hover_name='Location',
-            title='Hidden Gems: Accessibility vs Tourist Awareness',
-            color_discrete_map={
-                'Critical': '#FF5722',
-                'High': '#FF9800', 
-                'Medium': '#FFC107',
-                'Low': '#4CAF50'
-            }
-        )
-        fig_gems.update_layout(height=500)
-        st.plotly_chart(fig_gems, use_container_width=True)
+        fig_gems = hidden_gem_figures(**gem_filters)
+        show_chart(fig_gems)
         
         # Priority recommendations
         st.subheader("🎯 Priority Development Recommendations")
@@ -609,7 +941,7 @@ elif section == "🌱 Responsible Tourism":
             color_discrete_sequence=['#E57373', '#81C784']
         )
         fig_capacity.update_xaxes(tickangle=45)
-        st.plotly_chart(fig_capacity, use_container_width=True)
+        show_chart(fig_capacity)
     
     st.subheader("🤝 Community Partnership Programs")
     
@@ -746,7 +1078,7 @@ elif section == "📈 Impact Dashboard":
                 title='Active Practitioners Growth',
                 markers=True
             )
-        st.plotly_chart(fig_progress, use_container_width=True)
+        show_chart(fig_progress)
     
     with col2:
         if dashboard_view == "Economic Impact":
@@ -763,7 +1095,7 @@ elif section == "📈 Impact Dashboard":
                 y='Community_Programs',
                 title='Community Programs Growth'
             )
-        st.plotly_chart(fig_economic, use_container_width=True)
+        show_chart(fig_economic)
     
     # Success stories
     st.subheader("🏆 Success Stories")
@@ -825,6 +1157,7 @@ elif section == "📈 Impact Dashboard":
 
 elif section == "🎪 Festival Calendar":
     st.header("Cultural Festival Calendar")
+    festival_choices = section_options(tenant, 'festivals', 'festival_options', anexome_data.festival_options)
     
     # Filter section
     st.markdown('<div class="filter-section">', unsafe_allow_html=True)
@@ -834,65 +1167,37 @@ elif section == "🎪 Festival Calendar":
                                     ["All"] + ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                                               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
     with col2:
-        festival_state = st.selectbox("Select State", ["All"] + sorted(festivals_df['State'].unique()))
+        festival_state = st.selectbox("Select State", ["All"] + festival_choices['State'])
     with col3:
         visitor_range = st.selectbox("Expected Visitors", 
-                                   ["All", "Small (< 25K)", "Medium (25K-75K)", "Large (> 75K)"])
+                                   anexome_data.VISITOR_RANGES)
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Filter festival data
-    filtered_festivals = festivals_df.copy()
-    if selected_month != "All":
-        filtered_festivals = filtered_festivals[filtered_festivals['Month'] == selected_month]
-    if festival_state != "All":
-        filtered_festivals = filtered_festivals[filtered_festivals['State'] == festival_state]
-    
-    if visitor_range == "Small (< 25K)":
-        filtered_festivals = filtered_festivals[filtered_festivals['Expected_Visitors'] < 25000]
-    elif visitor_range == "Medium (25K-75K)":
-        filtered_festivals = filtered_festivals[(filtered_festivals['Expected_Visitors'] >= 25000) & 
-                                               (filtered_festivals['Expected_Visitors'] <= 75000)]
-    elif visitor_range == "Large (> 75K)":
-        filtered_festivals = filtered_festivals[filtered_festivals['Expected_Visitors'] > 75000]
+    festival_filters = {
+        'tenant': overlay_tenant(tenant, 'festivals'), 'month': selected_month,
+        'state': festival_state, 'visitor_range': visitor_range
+    }
+    log_section_access(section, festival_filters)
+    filtered_festivals = filter_festivals(**festival_filters)
     
     st.info(f"🎪 Found {len(filtered_festivals)} festivals matching your criteria")
+    export_buttons("festivals", filter_festivals, festival_filters)
     
     if not filtered_festivals.empty:
+        fig_monthly, fig_visitors, fig_calendar = festival_figures(**festival_filters)
+        
         # Festival visualizations
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_monthly = px.histogram(
-                filtered_festivals,
-                x='Month',
-                title='Festivals by Month',
-                color_discrete_sequence=['#FF6B6B']
-            )
-            st.plotly_chart(fig_monthly, use_container_width=True)
+            show_chart(fig_monthly)
         
         with col2:
-            fig_visitors = px.scatter(
-                filtered_festivals,
-                x='Duration_Days',
-                y='Expected_Visitors',
-                size='Expected_Visitors',
-                color='State',
-                hover_name='Festival',
-                title='Festival Duration vs Expected Visitors'
-            )
-            st.plotly_chart(fig_visitors, use_container_width=True)
+            show_chart(fig_visitors)
         
         # Festival calendar view
-        fig_calendar = px.bar(
-            filtered_festivals,
-            x='Festival',
-            y='Expected_Visitors',
-            color='Month',
-            title='Festival Calendar Overview',
-            hover_data=['State', 'Duration_Days']
-        )
-        fig_calendar.update_xaxes(tickangle=45)
-        st.plotly_chart(fig_calendar, use_container_width=True)
+        show_chart(fig_calendar)
         
         # Festival details
         st.subheader("🎭 Festival Details")
@@ -909,6 +1214,83 @@ elif section == "🎪 Festival Calendar":
     else:
         st.warning("⚠️ No festivals match the selected criteria.")
 
+elif section == "🗺️ State Explorer":
+    st.header("State & Region Explorer")
+    
+    key_index = get_key_index()
+    keyed_tables = {table: load_table(table) for table in anexome_data.KEYED_TABLES}
+    scorecards = refresh_scorecards()
+    
+    # Filter section
+    st.markdown('<div class="filter-section">', unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        explorer_region = st.selectbox("Region", sorted(set(key_index['Region']) | set(scorecards.table('Region')['Region'])))
+    with col2:
+        explorer_states = set(key_index['State'])
+        if tenant is not None:
+            explorer_states.update(*(delta['State'] for delta in get_overlay(tenant).values()))
+        region_states = sorted(state for state in explorer_states
+                               if anexome_data.STATE_REGIONS.get(state) == explorer_region)
+        explorer_state = st.selectbox("State", ["All"] + region_states)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Related rows come from index lookups, not merges
+    region_rows = anexome_data.related_rows(keyed_tables, key_index, region=explorer_region)
+    if explorer_state == "All":
+        related = dict(region_rows)
+        key_filter = {'region': explorer_region}
+        place = f"the {explorer_region} region"
+    else:
+        related = anexome_data.related_rows(keyed_tables, key_index, state=explorer_state)
+        key_filter = {'state': explorer_state}
+        place = explorer_state
+    if tenant is not None:
+        for table, delta in get_overlay(tenant).items():
+            related[table] = anexome_tenants.apply_overlay(
+                related[table], delta, table, anexome_data.rows_for_key, key_filter)
+    
+    at_risk_arts = related['art_forms'][related['art_forms']['Preservation_Status'] == 'Low']
+    urgent_gems = related['hidden_gems'][related['hidden_gems']['Preservation_Urgency'].isin(['Critical', 'High'])]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    summary = [
+        (len(related['art_forms']), "Traditional Art Forms"),
+        (len(at_risk_arts), "At-Risk Art Forms"),
+        (len(urgent_gems), "Urgent Hidden Gems"),
+        (len(related['festivals']), "Festivals"),
+    ]
+    for col, (value, label) in zip([col1, col2, col3, col4], summary):
+        with col:
+            st.markdown(f"""
+            <div class="metric-card">
+                <h3>{value}</h3>
+                <p>{label}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.subheader(f"📍 Cultural Profile of {place}")
+    
+    related_sections = [
+        ("🎭 Art Forms", related['art_forms'], "No art forms recorded"),
+        ("💎 Hidden Gems", related['hidden_gems'], "No hidden gems recorded"),
+        ("🎪 Festivals", related['festivals'], "No festivals recorded"),
+    ]
+    for title, rows, empty_message in related_sections:
+        st.markdown(f"**{title}**")
+        if rows.empty:
+            st.caption(empty_message)
+        else:
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+    
+    st.markdown(f"**🗺️ {explorer_region} Region Scorecard**")
+    st.dataframe(anexome_data.rows_for_key(scorecards.table('Region'), region=explorer_region),
+                 hide_index=True, use_container_width=True)
+    if explorer_state != "All":
+        st.markdown(f"**📍 {explorer_state} State Scorecard**")
+        st.dataframe(anexome_data.rows_for_key(scorecards.table('State'), state=explorer_state),
+                     hide_index=True, use_container_width=True)
+
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -916,4 +1298,6 @@ st.markdown("""
     <p>🏛️ <strong>Annexome</strong> - Preserving India's Cultural Heritage Through Responsible Tourism</p>
     <p>📊 Data sources: Government of India Open Data Platform, Ministry of Tourism, UNESCO</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+# Warm the other sections' caches in the background once the page has rendered
+start_cache_warmup()
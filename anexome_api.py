@@ -0,0 +1,264 @@
+"""Headless JSON API over the Art Forms, Hidden Gems and Festival Calendar queries
+
+Run locally with:  python anexome_api.py --port 8000
+"""
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+import anexome_data
+import anexome_search
+import anexome_tenants
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_SEARCH_RESULTS = 50
+CACHE_CONTROL = "public, max-age=300"
+TENANT_DIR = os.environ.get("ANEXOME_TENANT_DIR")
+
+@lru_cache(maxsize=None)
+def get_tables():
+    """Load every table and aggregation once per process"""
+    with ThreadPoolExecutor(max_workers=len(anexome_data.TABLE_LOADERS)) as executor:
+        futures = {name: executor.submit(loader) for name, loader in anexome_data.TABLE_LOADERS.items()}
+        tables = {name: future.result() for name, future in futures.items()}
+    for name, (table, aggregate) in anexome_data.TABLE_AGGREGATIONS.items():
+        tables[name] = aggregate(tables[table])
+    return tables
+
+@lru_cache(maxsize=None)
+def get_search_index():
+    """Build the search index once per process"""
+    tables = get_tables()
+    return anexome_search.SearchIndex.from_tables({table: tables[table] for table in anexome_search.SEARCH_FIELDS})
+
+@lru_cache(maxsize=None)
+def get_overlay(tenant):
+    """Load a tenant's delta tables once per process"""
+    return anexome_tenants.load_overlay(TENANT_DIR, tenant)
+
+@lru_cache(maxsize=None)
+def get_tenant_search_index(tenant):
+    """Search index over a tenant's own added and replaced rows"""
+    return anexome_search.SearchIndex.from_tables(
+        {table: delta[~delta['Hidden']] for table, delta in get_overlay(tenant).items()})
+
+def _tenant(params, table=None):
+    """Tenant named in the query string, or None when it has no edits (for this table)"""
+    tenant = params.get('tenant')
+    if tenant is None or not TENANT_DIR:
+        return None
+    if not anexome_tenants.valid_tenant(tenant):
+        raise ValueError("'tenant' may only contain lowercase letters, digits, '-' and '_'")
+    overlay = get_overlay(tenant)
+    if not overlay or (table is not None and table not in overlay):
+        return None
+    return tenant
+
+def _number(params, name, default, cast):
+    """Read a numeric query parameter, rejecting malformed values"""
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        raise ValueError(f"'{name}' must be a number") from None
+
+# Query string -> keyword arguments for each shared filter function
+def art_form_filters(params):
+    return {name: params.get(name, "All")
+            for name in ['region', 'category', 'preservation', 'unesco', 'state', 'age_group']}
+
+def hidden_gem_filters(params):
+    return {
+        'urgency': params.get('urgency', "All"),
+        'art_type': params.get('art_type', "All"),
+        'state': params.get('state', "All"),
+        'accessibility_range': (_number(params, 'accessibility_min', 0.0, float),
+                                _number(params, 'accessibility_max', 10.0, float)),
+        'awareness_range': (_number(params, 'awareness_min', 0, int),
+                            _number(params, 'awareness_max', 100, int)),
+    }
+
+def festival_filters(params):
+    return {name: params.get(name, "All") for name in ['month', 'state', 'visitor_range']}
+
+# URL name -> (table, filter function, query parser, options aggregation)
+DATASETS = {
+    'art-forms': ('art_forms', anexome_data.filter_art_forms, art_form_filters, 'art_form_options'),
+    'hidden-gems': ('hidden_gems', anexome_data.filter_hidden_gems, hidden_gem_filters, 'hidden_gem_options'),
+    'festivals': ('festivals', anexome_data.filter_festivals, festival_filters, 'festival_options'),
+}
+
+def _encode(payload):
+    """Serialize a payload and derive its ETag
+
+    The tag is weak because GZipMiddleware may send the same JSON gzip-encoded,
+    and a strong tag can't cover two content-codings.
+    """
+    body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return body, 'W/"' + hashlib.sha1(body).hexdigest() + '"'
+
+@lru_cache(maxsize=128)
+def run_query(dataset, filters, tenant=None):
+    """Run a filter query; pages and exports of the same query share the result"""
+    table, filter_fn, _, _ = DATASETS[dataset]
+    if tenant is None:
+        return filter_fn(get_tables()[table], **dict(filters))
+    # Tenants reuse the cached base result and merge in their edits
+    return anexome_tenants.apply_overlay(
+        run_query(dataset, filters), get_overlay(tenant)[table], table, filter_fn, dict(filters))
+
+@lru_cache(maxsize=4096)
+def render_page(dataset, filters, page, page_size, tenant=None):
+    """Encode one page of a filter query; pages are cached per query"""
+    result = run_query(dataset, filters, tenant)
+    start = (page - 1) * page_size
+    items = json.loads(result.iloc[start:start + page_size].to_json(orient='records'))
+    return _encode({
+        'dataset': dataset,
+        'total': len(result),
+        'page': page,
+        'page_size': page_size,
+        'items': items,
+    })
+
+@lru_cache(maxsize=None)
+def render_options(dataset, tenant=None):
+    """Encode the filter values available for a dataset"""
+    table, _, _, options_name = DATASETS[dataset]
+    options = get_tables()[options_name]
+    if tenant is not None:
+        delta = get_overlay(tenant)[table]
+        options_fn = anexome_data.TABLE_AGGREGATIONS[options_name][1]
+        options = anexome_tenants.merge_options(options, options_fn(delta[~delta['Hidden']]))
+    return _encode(options)
+
+@lru_cache(maxsize=4096)
+def render_search(text, limit, tenant=None):
+    """Encode the results of a search query"""
+    results = get_search_index().search(text, limit)
+    if tenant is not None:
+        results = anexome_tenants.merge_search_results(
+            results, get_tenant_search_index(tenant).search(text, limit), get_overlay(tenant), limit)
+    return _encode({'query': text, 'results': results})
+
+def _etag_matches(if_none_match, etag):
+    """Weak comparison of an ETag against an If-None-Match list (or '*')"""
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag.removeprefix('W/') in (tag.removeprefix('W/') for tag in tags)
+
+def _cached_response(request, body, etag):
+    """Send a cached body, or 304 when the client already holds this version"""
+    headers = {'ETag': etag, 'Cache-Control': CACHE_CONTROL}
+    if _etag_matches(request.headers.get('if-none-match', ''), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type='application/json', headers=headers)
+
+def _error(status_code, message):
+    return JSONResponse({'error': message}, status_code=status_code)
+
+# Endpoints are plain functions: Starlette runs them in its thread pool, so pandas
+# filtering and JSON encoding on a cache miss don't block the event loop
+def query(request):
+    dataset = request.path_params['dataset']
+    if dataset not in DATASETS:
+        return _error(404, f"Unknown dataset '{dataset}'")
+
+    params = request.query_params
+    try:
+        filters = DATASETS[dataset][2](params)
+        tenant = _tenant(params, DATASETS[dataset][0])
+        page = _number(params, 'page', 1, int)
+        page_size = _number(params, 'page_size', DEFAULT_PAGE_SIZE, int)
+    except ValueError as error:
+        return _error(400, str(error))
+    if page < 1 or not 1 <= page_size <= MAX_PAGE_SIZE:
+        return _error(400, f"'page' must be >= 1 and 'page_size' between 1 and {MAX_PAGE_SIZE}")
+
+    body, etag = render_page(dataset, tuple(filters.items()), page, page_size, tenant)
+    return _cached_response(request, body, etag)
+
+def export(request):
+    dataset = request.path_params['dataset']
+    if dataset not in DATASETS:
+        return _error(404, f"Unknown dataset '{dataset}'")
+
+    export_format = request.query_params.get('format', 'csv').lower()
+    formats = {extension: (name, mime) for name, (extension, mime) in anexome_data.EXPORT_FORMATS.items()}
+    if export_format not in formats:
+        return _error(400, f"'format' must be one of {', '.join(formats)}")
+    try:
+        filters = DATASETS[dataset][2](request.query_params)
+        tenant = _tenant(request.query_params, DATASETS[dataset][0])
+    except ValueError as error:
+        return _error(400, str(error))
+
+    name, mime = formats[export_format]
+    result = run_query(dataset, tuple(filters.items()), tenant)
+    return StreamingResponse(
+        anexome_data.stream_export(result, name),
+        media_type=mime,
+        headers={'Content-Disposition': f'attachment; filename="anexome_{dataset}.{export_format}"'}
+    )
+
+def search(request):
+    text = request.query_params.get('q', '').strip()
+    try:
+        limit = _number(request.query_params, 'limit', 10, int)
+        tenant = _tenant(request.query_params)
+    except ValueError as error:
+        return _error(400, str(error))
+    if not 1 <= limit <= MAX_SEARCH_RESULTS:
+        return _error(400, f"'limit' must be between 1 and {MAX_SEARCH_RESULTS}")
+    body, etag = render_search(text, limit, tenant)
+    return _cached_response(request, body, etag)
+
+def options(request):
+    dataset = request.path_params['dataset']
+    if dataset not in DATASETS:
+        return _error(404, f"Unknown dataset '{dataset}'")
+    try:
+        tenant = _tenant(request.query_params, DATASETS[dataset][0])
+    except ValueError as error:
+        return _error(400, str(error))
+    body, etag = render_options(dataset, tenant)
+    return _cached_response(request, body, etag)
+
+@asynccontextmanager
+async def lifespan(app):
+    # Load the data before accepting requests
+    get_tables()
+    get_search_index()
+    yield
+
+app = Starlette(
+    routes=[
+        Route('/api/search', search),
+        Route('/api/{dataset}', query),
+        Route('/api/{dataset}/options', options),
+        Route('/api/{dataset}/export', export),
+    ],
+    middleware=[Middleware(GZipMiddleware, minimum_size=500)],
+    lifespan=lifespan,
+)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Serve the Anexome query API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+    uvicorn.run('anexome_api:app', host=args.host, port=args.port, workers=args.workers)
@@ -0,0 +1,224 @@
+"""Compact binary transport for Plotly charts
+
+st.plotly_chart ships each figure as JSON, where numeric arrays are base64
+float64 and category columns repeat the same strings on every point. This
+module packs a figure into one compressed binary payload instead:
+
+- numeric arrays become raw little-endian buffers, narrowed to the smallest
+  integer type when every value is a whole number (floats stay float64, so
+  hover values are unchanged);
+- string arrays with repeats become a value list plus integer codes;
+- the JSON skeleton and all buffers are deflated together and sent once.
+
+The payload travels as raw bytes through a st.components.v2 component; the
+browser inflates it with DecompressionStream, rebuilds typed arrays and draws
+the chart with plotly.js. Experimental: Streamlit's own plotly.js isn't exposed
+to components, so the browser also downloads plotly.js once (from the Plotly
+CDN, or ANEXOME_PLOTLY_JS_URL for self-hosted or offline deployments). For the
+app's current charts, websocket compression of the JSON sends far less. Run
+this module to compare payload sizes with the JSON the app's charts send:
+
+    python anexome_charts.py
+"""
+import base64
+import json
+import os
+import struct
+import zlib
+from functools import lru_cache
+
+import numpy as np
+import plotly
+import plotly.graph_objects as go
+
+PLOTLY_JS_URL = os.environ.get(
+    "ANEXOME_PLOTLY_JS_URL", f"https://cdn.plot.ly/plotly-{plotly.offline.get_plotlyjs_version()}.min.js")
+DEFAULT_HEIGHT = 450
+MIN_ARRAY_LENGTH = 8
+BUFFER_ALIGNMENT = 8
+
+# Narrowest integer types tried for whole-number arrays, in order
+INTEGER_DTYPES = ['i1', 'u1', 'i2', 'u2', 'i4', 'u4']
+
+def _narrow(values):
+    """Smallest dtype that holds an array exactly"""
+    if values.dtype.kind == 'f' and not np.all(np.isfinite(values)):
+        return values
+    if values.dtype.kind in 'fiu' and len(values) and np.array_equal(values, np.round(values)):
+        low, high = values.min(), values.max()
+        for dtype in INTEGER_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return values.astype(dtype)
+    return values
+
+class _Packer:
+    """Collects binary buffers while rewriting a figure dict into a skeleton"""
+
+    def __init__(self):
+        self.buffers = []
+        self.size = 0
+
+    def add(self, values):
+        values = np.ascontiguousarray(values.astype(values.dtype.newbyteorder('<')))
+        offset = self.size
+        data = values.tobytes()
+        padding = -len(data) % BUFFER_ALIGNMENT
+        self.buffers.append(data + b'\0' * padding)
+        self.size += len(data) + padding
+        return {'$buf': [offset, len(values)], 'dtype': values.dtype.str[1:]}
+
+    def pack(self, node):
+        if isinstance(node, dict):
+            if 'bdata' in node and 'dtype' in node:
+                # Plotly's own base64 typed array
+                values = np.frombuffer(base64.b64decode(node['bdata']), dtype=node['dtype'])
+                packed = self.add(_narrow(values))
+                if 'shape' in node:
+                    packed['shape'] = [int(size) for size in str(node['shape']).split(',')]
+                return packed
+            return {key: self.pack(value) for key, value in node.items()}
+        if isinstance(node, list) and len(node) >= MIN_ARRAY_LENGTH:
+            if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in node):
+                return self.add(_narrow(np.array(node)))
+            if all(isinstance(value, str) for value in node):
+                labels, codes = np.unique(np.array(node, dtype=object).astype(str), return_inverse=True)
+                if len(labels) < len(node):
+                    return {'$dict': labels.tolist(), '$codes': self.add(_narrow(codes))}
+        if isinstance(node, list):
+            return [self.pack(value) for value in node]
+        return node
+
+def encode_figure(fig):
+    """Pack a figure into one deflated buffer: skeleton length, JSON skeleton, aligned array data"""
+    packer = _Packer()
+    skeleton = json.dumps(packer.pack(json.loads(fig.to_json())), separators=(',', ':')).encode('utf-8')
+    header = struct.pack('<I', len(skeleton)) + skeleton
+    header += b'\0' * (-len(header) % BUFFER_ALIGNMENT)
+    return zlib.compress(header + b''.join(packer.buffers), 9)
+
+# Loads plotly.js once per page, inflates each payload, rebuilds typed arrays and plots
+COMPONENT_JS = """
+function loadPlotly() {
+  // Shared by every chart on the page, each of which evaluates this module
+  window.anexomePlotly = window.anexomePlotly || new Promise((resolve, reject) => {
+    if (window.Plotly) return resolve(window.Plotly);
+    const script = document.createElement('script');
+    script.src = '%(plotly_js_url)s';
+    script.onload = () => resolve(window.Plotly);
+    script.onerror = reject;
+    document.head.appendChild(script);
+  });
+  return window.anexomePlotly;
+}
+
+async function decode(payload) {
+  const stream = new Blob([payload]).stream().pipeThrough(new DecompressionStream('deflate'));
+  const buffer = await new Response(stream).arrayBuffer();
+  const length = new DataView(buffer).getUint32(0, true);
+  const skeleton = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, length)));
+  const base = Math.ceil((4 + length) / %(alignment)d) * %(alignment)d;
+  const types = {i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array, i4: Int32Array,
+                 u4: Uint32Array, f4: Float32Array, f8: Float64Array};
+  const array = ref => new types[ref.dtype](buffer, base + ref.$buf[0], ref.$buf[1]);
+  const unpack = node => {
+    if (Array.isArray(node)) return node.map(unpack);
+    if (node === null || typeof node !== 'object') return node;
+    if ('$dict' in node) return Array.from(array(node.$codes), code => node.$dict[code]);
+    if ('$buf' in node) {
+      const values = array(node);
+      if (!node.shape || node.shape.length < 2) return values;
+      const width = node.shape[1];
+      return Array.from({length: node.shape[0]},
+                        (_, row) => Array.from(values.subarray(row * width, (row + 1) * width)));
+    }
+    return Object.fromEntries(Object.entries(node).map(([key, value]) => [key, unpack(value)]));
+  };
+  return unpack(skeleton);
+}
+
+export default function(component) {
+  const { data, parentElement } = component;
+  let chart = parentElement.querySelector('.anexome-chart');
+  if (!chart) {
+    chart = document.createElement('div');
+    chart.className = 'anexome-chart';
+    parentElement.appendChild(chart);
+  }
+  Promise.all([loadPlotly(), decode(data)]).then(([Plotly, figure]) => {
+    const layout = Object.assign(figure.layout || {}, {autosize: true});
+    delete layout.width;
+    chart.style.height = layout.height + 'px';
+    Plotly.react(chart, figure.data, layout, {responsive: true, displaylogo: false});
+  });
+}
+""" % {'plotly_js_url': PLOTLY_JS_URL, 'alignment': BUFFER_ALIGNMENT}
+
+# Inline component code travels with every chart, so drop the indentation and comments
+COMPONENT_JS = '\n'.join(line.strip() for line in COMPONENT_JS.splitlines()
+                         if line.strip() and not line.strip().startswith('//'))
+
+@lru_cache(maxsize=None)
+def _chart_component():
+    """Register the chart component once per process"""
+    import streamlit as st
+
+    # plotly.js puts its stylesheet in the page head, so the chart can't sit in a shadow root
+    return st.components.v2.component("anexome_binary_chart", js=COMPONENT_JS, isolate_styles=False)
+
+def plotly_chart_binary(fig, key=None):
+    """Draw a figure at container width like st.plotly_chart, sending the packed binary payload"""
+    if fig.layout.height is None:
+        fig = go.Figure(fig).update_layout(height=DEFAULT_HEIGHT)
+    return _chart_component()(data=encode_figure(fig), key=key, height=fig.layout.height)
+
+def payload_sizes(fig, spec=None):
+    """Bytes sent for one figure: the JSON st.plotly_chart sends (and its deflated size, as
+    with server.enableWebsocketCompression), and the binary payload plus the component code"""
+    spec = spec if spec is not None else fig.to_json()
+    return {
+        'json': len(spec.encode('utf-8')),
+        'json_deflated': len(zlib.compress(spec.encode('utf-8'), 9)),
+        'binary': len(encode_figure(fig)) + len(COMPONENT_JS.encode('utf-8')),
+    }
+
+def plotly_js_size():
+    """Compressed size of the plotly.js download the binary charts need once per browser"""
+    return len(zlib.compress(plotly.offline.get_plotlyjs().encode('utf-8'), 9))
+
+def app_chart_specs(app_path="Anexome.py", timeout=60):
+    """Run every section of the app through AppTest and collect the chart JSON it sends"""
+    import plotly.io as pio
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(app_path, default_timeout=timeout)
+    app.run()
+    section_box = next(widget for widget in app.sidebar.selectbox if widget.label == "Select Section")
+    specs = []
+    for section in section_box.options:
+        app.sidebar.selectbox[0].select(section).run()
+        for position, chart in enumerate(app.get('plotly_chart')):
+            figure = pio.from_json(chart.proto.spec, skip_invalid=True)
+            title = figure.layout.title.text or f"chart {position + 1}"
+            specs.append((section, title, chart.proto.spec, figure))
+    return specs
+
+if __name__ == '__main__':
+    # Measure the JSON charts, not the binary ones
+    os.environ.pop("ANEXOME_BINARY_CHARTS", None)
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Anexome.py")
+    totals = {'json': 0, 'json_deflated': 0, 'binary': 0}
+    print(f"{'chart':<52} {'JSON':>8} {'deflated':>9} {'binary':>8} {'saved':>6}")
+    print(f"{'':<52} {'':>8} {'':>9} {'+ code':>8}")
+    for section, title, spec, figure in app_chart_specs(app_path):
+        sizes = payload_sizes(figure, spec)
+        for name in totals:
+            totals[name] += sizes[name]
+        label = f"{section} / {title}"[:52]
+        print(f"{label:<52} {sizes['json']:>8} {sizes['json_deflated']:>9} {sizes['binary']:>8} "
+              f"{1 - sizes['binary'] / sizes['json']:>6.0%}")
+    print(f"{'total':<52} {totals['json']:>8} {totals['json_deflated']:>9} {totals['binary']:>8} "
+          f"{1 - totals['binary'] / totals['json']:>6.0%}")
+    first_visit = totals['binary'] + plotly_js_size()
+    print(f"{'total with the plotly.js download (compressed)':<52} {totals['json']:>8} "
+          f"{totals['json_deflated']:>9} {first_visit:>8} {1 - first_visit / totals['json']:>6.0%}")
@@ -0,0 +1,371 @@
+"""Cultural heritage tables and the filter queries shared by the app and the API"""
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Sample data generation (simulating real data sources)
+def load_art_forms():
+    """Load traditional art forms data"""
+    return pd.DataFrame({
+        'Art_Form': ['Bharatanatyam', 'Kathak', 'Kuchipudi', 'Odissi', 'Manipuri', 
+                     'Mohiniyattam', 'Sattriya', 'Kathakali', 'Yakshagana', 'Chhau',
+                     'Bhangra', 'Garba', 'Lavani', 'Bihu', 'Giddha'],
+        'State': ['Tamil Nadu', 'Uttar Pradesh', 'Andhra Pradesh', 'Odisha', 'Manipur',
+                 'Kerala', 'Assam', 'Kerala', 'Karnataka', 'West Bengal',
+                 'Punjab', 'Gujarat', 'Maharashtra', 'Assam', 'Punjab'],
+        'Region': ['South', 'North', 'South', 'East', 'Northeast', 
+                  'South', 'Northeast', 'South', 'South', 'East',
+                  'North', 'West', 'West', 'Northeast', 'North'],
+        'Category': ['Classical Dance', 'Classical Dance', 'Classical Dance', 'Classical Dance', 'Classical Dance',
+                    'Classical Dance', 'Classical Dance', 'Classical Dance', 'Theatre', 'Dance Drama',
+                    'Folk Dance', 'Folk Dance', 'Folk Dance', 'Folk Dance', 'Folk Dance'],
+        'Practitioners': [15000, 25000, 8000, 6000, 3000, 4000, 2000, 5000, 3500, 4500,
+                         12000, 18000, 9000, 7000, 8500],
+        'Tourist_Interest': [85, 78, 72, 68, 45, 65, 35, 88, 42, 58,
+                           70, 75, 62, 48, 55],
+        'Preservation_Status': ['High', 'High', 'Medium', 'Medium', 'Low', 'Medium', 'Low', 'High', 'Low', 'Medium',
+                               'High', 'High', 'Medium', 'Medium', 'Medium'],
+        'UNESCO_Recognition': ['Yes', 'Yes', 'No', 'No', 'No', 'No', 'Yes', 'Yes', 'No', 'No',
+                              'No', 'No', 'No', 'No', 'No'],
+        'Age_Group': ['500+ years', '400+ years', '300+ years', '200+ years', '300+ years',
+                     '400+ years', '500+ years', '600+ years', '400+ years', '300+ years',
+                     '300+ years', '500+ years', '200+ years', '400+ years', '300+ years']
+    })
+
+def load_tourism():
+    """Load monthly tourism data"""
+    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    return pd.DataFrame({
+        'Month': months,
+        'Cultural_Tourists': [120000, 150000, 200000, 180000, 160000, 140000,
+                             130000, 145000, 175000, 220000, 250000, 200000],
+        'Art_Festival_Events': [15, 18, 25, 22, 20, 18, 16, 19, 23, 28, 35, 25],
+        'Revenue_Crores': [45, 58, 78, 72, 65, 55, 52, 58, 70, 88, 95, 80],
+        'International_Visitors': [8000, 12000, 18000, 15000, 12000, 9000,
+                                  8500, 11000, 14000, 22000, 28000, 18000],
+        'Domestic_Visitors': [112000, 138000, 182000, 165000, 148000, 131000,
+                             121500, 134000, 161000, 198000, 222000, 182000]
+    })
+
+def load_districts(path=None):
+    """Load district-level tourism data, the source of the region and state scorecards"""
+    if path is not None:
+        districts = pd.read_csv(path)
+    else:
+        districts = pd.DataFrame({
+            'District': ['Amritsar', 'Patiala', 'Jaipur', 'Udaipur', 'Varanasi', 'Lucknow',
+                         'Krishna', 'Visakhapatnam', 'Mysuru', 'Udupi', 'Thrissur', 'Kannur',
+                         'Thanjavur', 'Madurai', 'Siddipet', 'Warangal', 'Madhubani', 'Patna',
+                         'Puri', 'Ganjam', 'Bankura', 'Birbhum', 'Kutch', 'Ahmedabad',
+                         'Palghar', 'Aurangabad', 'Majuli', 'Kamrup', 'Imphal West', 'Bishnupur',
+                         'Dindori', 'Chhatarpur'],
+            'State': ['Punjab', 'Punjab', 'Rajasthan', 'Rajasthan', 'Uttar Pradesh', 'Uttar Pradesh',
+                      'Andhra Pradesh', 'Andhra Pradesh', 'Karnataka', 'Karnataka', 'Kerala', 'Kerala',
+                      'Tamil Nadu', 'Tamil Nadu', 'Telangana', 'Telangana', 'Bihar', 'Bihar',
+                      'Odisha', 'Odisha', 'West Bengal', 'West Bengal', 'Gujarat', 'Gujarat',
+                      'Maharashtra', 'Maharashtra', 'Assam', 'Assam', 'Manipur', 'Manipur',
+                      'Madhya Pradesh', 'Madhya Pradesh'],
+            'Art_Forms_Count': [4, 3, 6, 3, 5, 4, 3, 3, 2, 3, 5, 3, 4, 4, 3, 5,
+                                3, 3, 2, 4, 4, 2, 5, 8, 6, 3, 2, 4, 2, 4, 7, 8],
+            'Tourist_Footfall': [60000, 108000, 58000, 100000, 61000, 63000, 43000, 43000,
+                                 54000, 90000, 71000, 62000, 83000, 73000, 61000, 100000,
+                                 54000, 26000, 56000, 53000, 69000, 62000, 144000, 125000,
+                                 102000, 149000, 39000, 45000, 37000, 59000, 97000, 183000],
+            'Infrastructure_Score': [8.4, 7.2, 7.9, 7.7, 7.9, 7.7, 9.3, 7.7, 9.4, 7.6, 8.6, 8.4, 9.3, 7.7, 8.9, 8.1,
+                                     6.4, 6.0, 6.5, 5.9, 6.4, 6.0, 8.4, 7.6, 8.2, 7.8, 6.5, 4.5, 6.0, 5.0, 7.1, 6.5],
+            'Digitization_Level': [72, 58, 69, 61, 68, 62, 81, 75, 85, 71, 80, 76, 84, 72, 84, 72,
+                                   46, 44, 50, 40, 49, 41, 74, 66, 73, 67, 36, 34, 44, 26, 58, 52],
+            'Investment_Crores': [19, 27, 13, 15, 23, 28, 21, 13, 19, 18, 24, 21, 14, 25, 11, 14,
+                                  13, 15, 20, 9, 16, 12, 30, 34, 42, 34, 13, 9, 7, 16, 47, 48],
+        })
+    if 'Region' not in districts and 'State' in districts:
+        districts['Region'] = districts['State'].map(STATE_REGIONS)
+        unmapped = districts.loc[districts['Region'].isna(), 'State'].dropna().unique()
+        if len(unmapped):
+            raise ValueError(f"No region known for {', '.join(map(str, unmapped))}; "
+                             f"add a Region column to the district data")
+    return districts
+
+def load_hidden_gems():
+    """Load hidden gems data"""
+    return pd.DataFrame({
+        'Location': ['Mithila (Bihar)', 'Warli (Maharashtra)', 'Pattachitra (Odisha)', 
+                     'Phad (Rajasthan)', 'Kalamkari (Andhra Pradesh)', 'Tanjore (Tamil Nadu)',
+                     'Gond (Madhya Pradesh)', 'Pichwai (Rajasthan)', 'Madhubani (Bihar)',
+                     'Cheriyal (Telangana)'],
+        'Art_Type': ['Painting', 'Tribal Art', 'Scroll Painting', 'Narrative Painting',
+                    'Hand Painting', 'Classical Painting', 'Contemporary Tribal', 'Temple Art',
+                    'Folk Painting', 'Scroll Painting'],
+        'Accessibility_Score': [3.2, 4.1, 5.8, 6.2, 7.1, 8.5, 2.8, 7.8, 4.5, 5.2],
+        'Tourist_Awareness': [25, 35, 45, 55, 65, 85, 20, 70, 30, 40],
+        'Preservation_Urgency': ['High', 'High', 'Medium', 'Medium', 'Low', 'Low', 'Critical', 'Medium', 'High', 'Medium'],
+        'Annual_Visitors': [5000, 8000, 15000, 25000, 35000, 75000, 3000, 45000, 7000, 12000],
+        'State': ['Bihar', 'Maharashtra', 'Odisha', 'Rajasthan', 'Andhra Pradesh', 'Tamil Nadu',
+                 'Madhya Pradesh', 'Rajasthan', 'Bihar', 'Telangana']
+    })
+
+def load_festivals():
+    """Load festival calendar data"""
+    return pd.DataFrame({
+        'Festival': ['Khajuraho Dance Festival', 'Konark Dance Festival', 'Mamallapuram Dance Festival',
+                    'Hampi Festival', 'Rajasthan Folk Festival', 'Kerala Kathakali Festival',
+                    'Manipur Sangai Festival', 'Assam Tea Festival', 'Gujarat Navratri',
+                    'Punjab Baisakhi Festival'],
+        'Month': ['Feb', 'Dec', 'Jan', 'Nov', 'Oct', 'Aug', 'Nov', 'Nov', 'Oct', 'Apr'],
+        'Duration_Days': [7, 5, 4, 3, 10, 6, 10, 5, 9, 3],
+        'Expected_Visitors': [50000, 35000, 25000, 40000, 75000, 20000, 30000, 15000, 200000, 100000],
+        'State': ['Madhya Pradesh', 'Odisha', 'Tamil Nadu', 'Karnataka', 'Rajasthan', 'Kerala',
+                 'Manipur', 'Assam', 'Gujarat', 'Punjab']
+    })
+
+# Filter options shown by each section, derived from a single table; blank cells are not options
+def art_form_options(art_forms):
+    """Sorted filter values for the Art Forms section"""
+    return {column: sorted(art_forms[column].dropna().unique())
+            for column in ['Region', 'Category', 'Preservation_Status', 'State', 'Age_Group']}
+
+def hidden_gem_options(hidden_gems):
+    """Sorted filter values for the Hidden Gems section"""
+    return {column: sorted(hidden_gems[column].dropna().unique())
+            for column in ['Preservation_Urgency', 'Art_Type', 'State']}
+
+def festival_options(festivals):
+    """Sorted filter values for the Festival Calendar section"""
+    return {'State': sorted(festivals['State'].dropna().unique())}
+
+def table_version(frame):
+    """Content hash of a table, used to key caches derived from it"""
+    return format(int(pd.util.hash_pandas_object(frame).sum()) & 0xFFFFFFFFFFFFFFFF, '016x')
+
+# Tables are independent, so they load concurrently
+TABLE_LOADERS = {
+    'art_forms': load_art_forms,
+    'tourism': load_tourism,
+    'districts': load_districts,
+    'hidden_gems': load_hidden_gems,
+    'festivals': load_festivals,
+}
+
+# Aggregations start as soon as their one source table arrives
+TABLE_AGGREGATIONS = {
+    'art_form_options': ('art_forms', art_form_options),
+    'hidden_gem_options': ('hidden_gems', hidden_gem_options),
+    'festival_options': ('festivals', festival_options),
+    'tourism_version': ('tourism', table_version),
+}
+
+# Region of every state and union territory; art_forms also carries this pairing
+STATE_REGIONS = {
+    'Andhra Pradesh': 'South', 'Arunachal Pradesh': 'Northeast', 'Assam': 'Northeast', 'Bihar': 'East',
+    'Chhattisgarh': 'Central', 'Goa': 'West', 'Gujarat': 'West', 'Haryana': 'North',
+    'Himachal Pradesh': 'North', 'Jharkhand': 'East', 'Karnataka': 'South', 'Kerala': 'South',
+    'Madhya Pradesh': 'Central', 'Maharashtra': 'West', 'Manipur': 'Northeast', 'Meghalaya': 'Northeast',
+    'Mizoram': 'Northeast', 'Nagaland': 'Northeast', 'Odisha': 'East', 'Punjab': 'North',
+    'Rajasthan': 'North', 'Sikkim': 'Northeast', 'Tamil Nadu': 'South', 'Telangana': 'South',
+    'Tripura': 'Northeast', 'Uttar Pradesh': 'North', 'Uttarakhand': 'North', 'West Bengal': 'East',
+    'Andaman and Nicobar Islands': 'South', 'Chandigarh': 'North',
+    'Dadra and Nagar Haveli and Daman and Diu': 'West', 'Delhi': 'North', 'Jammu and Kashmir': 'North',
+    'Ladakh': 'North', 'Lakshadweep': 'South', 'Puducherry': 'South',
+}
+
+# Tables linked by the state/region index, and the key columns each one has
+KEYED_TABLES = {
+    'art_forms': ['State', 'Region'],
+    'hidden_gems': ['State'],
+    'festivals': ['State'],
+}
+
+def build_key_index(tables):
+    """Map each State and Region value to the row positions holding it, per table
+
+    Returns {'State': {state: {table: positions}}, 'Region': {region: {table: positions}}}.
+    Tables without a Region column are linked to regions through STATE_REGIONS.
+    """
+    index = {'State': {}, 'Region': {}}
+    for table, columns in KEYED_TABLES.items():
+        frame = tables[table]
+        keys = {column: frame[column] for column in columns}
+        if 'Region' not in keys:
+            keys['Region'] = frame['State'].map(STATE_REGIONS)
+        for column, values in keys.items():
+            for value, positions in values.groupby(values.to_numpy(), sort=False).indices.items():
+                index[column].setdefault(value, {})[table] = positions
+    return index
+
+def related_rows(tables, index, state=None, region=None):
+    """Rows of every keyed table for a state or region, looked up by position"""
+    column, value = ('State', state) if state is not None else ('Region', region)
+    positions = index[column].get(value, {})
+    return {table: tables[table].take(positions[table]) if table in positions else tables[table].iloc[:0]
+            for table in KEYED_TABLES}
+
+def rows_for_key(frame, state=None, region=None):
+    """Rows of any keyed table for a state or region, by scanning; use the index for base tables"""
+    if state is not None:
+        return frame[frame['State'] == state]
+    regions = frame['Region'] if 'Region' in frame else frame['State'].map(STATE_REGIONS)
+    return frame[regions == region]
+
+# Section filters; "All" leaves a column unfiltered
+VISITOR_RANGES = ["All", "Small (< 25K)", "Medium (25K-75K)", "Large (> 75K)"]
+
+def filter_art_forms(art_forms, region="All", category="All", preservation="All",
+                     unesco="All", state="All", age_group="All"):
+    """Filter art forms by the Art Forms section selections"""
+    filtered_df = art_forms
+    if region != "All":
+        filtered_df = filtered_df[filtered_df['Region'] == region]
+    if category != "All":
+        filtered_df = filtered_df[filtered_df['Category'] == category]
+    if preservation != "All":
+        filtered_df = filtered_df[filtered_df['Preservation_Status'] == preservation]
+    if unesco != "All":
+        filtered_df = filtered_df[filtered_df['UNESCO_Recognition'] == unesco]
+    if state != "All":
+        filtered_df = filtered_df[filtered_df['State'] == state]
+    if age_group != "All":
+        filtered_df = filtered_df[filtered_df['Age_Group'] == age_group]
+    return filtered_df
+
+def filter_hidden_gems(hidden_gems, urgency="All", art_type="All", state="All",
+                       accessibility_range=(0.0, 10.0), awareness_range=(0, 100)):
+    """Filter hidden gems by the Hidden Gems section selections"""
+    filtered_gems = hidden_gems
+    if urgency != "All":
+        filtered_gems = filtered_gems[filtered_gems['Preservation_Urgency'] == urgency]
+    if art_type != "All":
+        filtered_gems = filtered_gems[filtered_gems['Art_Type'] == art_type]
+    if state != "All":
+        filtered_gems = filtered_gems[filtered_gems['State'] == state]
+
+    return filtered_gems[
+        (filtered_gems['Accessibility_Score'] >= accessibility_range[0]) &
+        (filtered_gems['Accessibility_Score'] <= accessibility_range[1]) &
+        (filtered_gems['Tourist_Awareness'] >= awareness_range[0]) &
+        (filtered_gems['Tourist_Awareness'] <= awareness_range[1])
+    ]
+
+def filter_festivals(festivals, month="All", state="All", visitor_range="All"):
+    """Filter festivals by the Festival Calendar section selections"""
+    filtered_festivals = festivals
+    if month != "All":
+        filtered_festivals = filtered_festivals[filtered_festivals['Month'] == month]
+    if state != "All":
+        filtered_festivals = filtered_festivals[filtered_festivals['State'] == state]
+
+    if visitor_range == "Small (< 25K)":
+        filtered_festivals = filtered_festivals[filtered_festivals['Expected_Visitors'] < 25000]
+    elif visitor_range == "Medium (25K-75K)":
+        filtered_festivals = filtered_festivals[(filtered_festivals['Expected_Visitors'] >= 25000) &
+                                               (filtered_festivals['Expected_Visitors'] <= 75000)]
+    elif visitor_range == "Large (> 75K)":
+        filtered_festivals = filtered_festivals[filtered_festivals['Expected_Visitors'] > 75000]
+    return filtered_festivals
+
+# Exports are written chunk by chunk so a large result is never serialized in one piece
+EXPORT_CHUNK_ROWS = 100_000
+
+# Format name -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+def iter_chunks(frame, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield consecutive row slices of a frame without copying it"""
+    for start in range(0, len(frame), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+def stream_csv(frame, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield a frame as UTF-8 CSV bytes, one chunk of rows at a time"""
+    if frame.empty:
+        yield frame.to_csv(index=False).encode('utf-8')
+        return
+    for i, chunk in enumerate(iter_chunks(frame, chunk_rows)):
+        yield chunk.to_csv(index=False, header=i == 0).encode('utf-8')
+
+class _ChunkSink:
+    """Write-only file object that hands back whatever was written since the last drain"""
+
+    def __init__(self):
+        self.closed = False
+        self._parts = []
+        self._position = 0
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+def stream_parquet(frame, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield a frame as Parquet bytes, writing one row group per chunk"""
+    sink = _ChunkSink()
+    schema = pa.Table.from_pandas(frame.iloc[:chunk_rows], preserve_index=False).schema
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in iter_chunks(frame, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            yield sink.drain()
+    yield sink.drain()
+
+def stream_export(frame, export_format, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield a frame in one of EXPORT_FORMATS"""
+    if export_format == 'CSV':
+        return stream_csv(frame, chunk_rows)
+    if export_format == 'Parquet':
+        return stream_parquet(frame, chunk_rows)
+    raise ValueError(f"Unsupported export format '{export_format}'")
+
+def export_bytes(frame, export_format):
+    """Build a whole export for a download button, spooling the chunks through a temporary file"""
+    with tempfile.TemporaryFile() as export_file:
+        for chunk in stream_export(frame, export_format):
+            export_file.write(chunk)
+        export_file.seek(0)
+        return export_file.read()
+
+if __name__ == '__main__':
+    # Check that each export is a download Streamlit accepts and reads back to the same table
+    import io
+
+    from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+    readers = {'CSV': pd.read_csv, 'Parquet': pd.read_parquet}
+    for table in ['art_forms', 'hidden_gems', 'festivals']:
+        frame = TABLE_LOADERS[table]()
+        for export_format in EXPORT_FORMATS:
+            data, _ = convert_data_to_bytes_and_infer_mime(
+                export_bytes(frame, export_format), TypeError("unsupported download data"))
+            restored = readers[export_format](io.BytesIO(data))
+            assert restored.shape == frame.shape and list(restored.columns) == list(frame.columns), \
+                f"{table} {export_format} export doesn't match the table"
+            print(f"{table:<12} {export_format:<8} {len(data):>7} bytes  ok")
+
+    # Option lists must tolerate columns mixing blank and filled cells, as tenant edits do
+    for name, (table, options_fn) in TABLE_AGGREGATIONS.items():
+        if not name.endswith('_options'):
+            continue
+        frame = TABLE_LOADERS[table]()
+        columns = list(options_fn(frame))
+        frame.loc[0, columns] = None
+        options = options_fn(frame)
+        assert all(not pd.isna(value) for values in options.values() for value in values), \
+            f"{name} offers a blank option"
+        print(f"{name:<21} blank cells skipped  ok")
@@ -0,0 +1,89 @@
+"""Seasonal forecasts for monthly tourism and revenue series
+
+Additive Holt-Winters (level, trend and seasonal exponential smoothing) run
+over a 2-D array with one row per series, so thousands of series (every
+state x visitor type, say) are fitted in a single pass over time instead of
+a Python loop per series.
+"""
+import numpy as np
+import pandas as pd
+
+SEASON_LENGTH = 12
+HORIZON = 12
+Z_95 = 1.96
+
+def holt_winters(values, season_length=SEASON_LENGTH, horizon=HORIZON,
+                 alpha=0.3, beta=0.05, gamma=0.2, z=Z_95):
+    """Forecast each row of a (series, observations) array
+
+    Returns (forecast, lower, upper), each shaped (series, horizon).
+    Series must be complete and cover at least one season.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[np.newaxis, :]
+    n_obs = values.shape[1]
+    if n_obs < season_length:
+        raise ValueError(f"Need at least {season_length} observations, got {n_obs}")
+
+    # Seasonal decomposition of the first seasons gives the starting state
+    first_mean = values[:, :season_length].mean(axis=1)
+    if n_obs >= 2 * season_length:
+        trend = (values[:, season_length:2 * season_length].mean(axis=1) - first_mean) / season_length
+    else:
+        trend = np.zeros(len(values))
+    # Detrend the first season around its mean, then start one step before it
+    offsets = np.arange(season_length) - (season_length - 1) / 2
+    season = values[:, :season_length] - first_mean[:, np.newaxis] - trend[:, np.newaxis] * offsets
+    level = first_mean - trend * (season_length + 1) / 2
+
+    errors = np.empty_like(values)
+    for t in range(n_obs):
+        observed = values[:, t]
+        seasonal = season[:, t % season_length]
+        errors[:, t] = observed - (level + trend + seasonal)
+        new_level = alpha * (observed - seasonal) + (1 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        season[:, t % season_length] = gamma * (observed - new_level) + (1 - gamma) * seasonal
+        level = new_level
+
+    steps = np.arange(1, horizon + 1)
+    future_season = season[:, (n_obs + steps - 1) % season_length]
+    forecast = level[:, np.newaxis] + trend[:, np.newaxis] * steps + future_season
+
+    # The first season only seeds the model, so its errors say nothing; with a
+    # single season, fall back to month-on-month changes as a wide estimate
+    if n_obs >= 2 * season_length:
+        sigma = np.sqrt(np.mean(errors[:, season_length:] ** 2, axis=1))
+    else:
+        sigma = np.std(np.diff(values, axis=1), axis=1)
+    spread = z * sigma[:, np.newaxis] * np.sqrt(steps)
+    return forecast, forecast - spread, forecast + spread
+
+def forecast_columns(frame, columns, **params):
+    """Forecast several columns of a time-ordered frame, one series per column
+
+    Returns a long frame with Series, Step, Forecast, Lower and Upper columns.
+    """
+    forecast, lower, upper = holt_winters(frame[columns].to_numpy().T, **params)
+    return _long_frame(pd.Index(columns, name='Series'), forecast, lower, upper)
+
+def forecast_panel(frame, keys, time_column, value_column, **params):
+    """Forecast one series per combination of key columns in a long frame
+
+    Rows are pivoted into a (series, time) matrix ordered by time_column.
+    Returns a long frame with the key columns, Step, Forecast, Lower and Upper.
+    """
+    matrix = frame.pivot_table(index=keys, columns=time_column, values=value_column, aggfunc='sum')
+    forecast, lower, upper = holt_winters(matrix.sort_index(axis=1).to_numpy(), **params)
+    return _long_frame(matrix.index, forecast, lower, upper)
+
+def _long_frame(index, forecast, lower, upper):
+    """Flatten (series, horizon) arrays into one row per series and step"""
+    horizon = forecast.shape[1]
+    result = index.repeat(horizon).to_frame(index=False)
+    result['Step'] = np.tile(np.arange(1, horizon + 1), len(index))
+    result['Forecast'] = forecast.ravel()
+    result['Lower'] = lower.ravel()
+    result['Upper'] = upper.ravel()
+    return result
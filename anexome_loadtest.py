@@ -0,0 +1,321 @@
+"""Load test: replay simulated dashboard sessions at increasing concurrency
+
+Each virtual user replays randomly generated but realistic sessions (section
+switches, filter changes, slider drags, searches) and the latency of every
+rerun is recorded. Two targets are supported:
+
+- server (default): launches `streamlit run Anexome.py` (or connects to --url)
+  and drives one browser-like websocket session per user, so users share the
+  server's caches and compete for it exactly as real visitors do;
+- apptest: runs the script logic through Streamlit's AppTest without a server.
+  AppTest keeps process-global state, so each user runs in its own process
+  and caches are not shared between users.
+
+Examples:
+    python anexome_loadtest.py --users 1,4,16,32 --sessions 2
+    python anexome_loadtest.py --url http://127.0.0.1:8501 --users 8
+    python anexome_loadtest.py --target apptest --users 1,2,4
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import anexome_data
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Anexome.py")
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+SEARCH_TERMS = ["kathakali", "madhubani", "mohiniattam", "odisha", "scroll painting", "navratri"]
+SEARCH_LABEL = "🔎 Search"
+SECTION_LABEL = "Select Section"
+SLIDER_LABEL = "Accessibility Score Range"
+SERVER_START_TIMEOUT = 60
+
+# Sections in the order users usually visit them, then the rest
+SECTIONS = ["🏠 Overview", "🎭 Art Forms", "📊 Tourism Analytics", "💎 Hidden Gems",
+            "🎪 Festival Calendar", "🗺️ State Explorer", "🌱 Responsible Tourism", "📈 Impact Dashboard"]
+
+def widget_choices(tables):
+    """Values each section's filter widgets can take, from the data the app offers"""
+    art_forms = anexome_data.art_form_options(tables['art_forms'])
+    gems = anexome_data.hidden_gem_options(tables['hidden_gems'])
+    festivals = anexome_data.festival_options(tables['festivals'])
+    return {
+        "🎭 Art Forms": {
+            "Region": art_forms['Region'], "Category": art_forms['Category'],
+            "Preservation Status": art_forms['Preservation_Status'], "UNESCO Recognition": ["Yes", "No"],
+            "State": art_forms['State'], "Age Group": art_forms['Age_Group'],
+        },
+        "📊 Tourism Analytics": {
+            "Visitor Type": ["Domestic", "International"], "Metric View": ["Quarterly", "Seasonal"],
+        },
+        "💎 Hidden Gems": {
+            "Preservation Urgency": gems['Preservation_Urgency'], "Art Type": gems['Art_Type'],
+            "State": gems['State'],
+        },
+        "🎪 Festival Calendar": {
+            "Select Month": MONTHS, "Select State": festivals['State'],
+            "Expected Visitors": anexome_data.VISITOR_RANGES[1:],
+        },
+    }
+
+def generate_session(rng, choices, length=12):
+    """A list of (widget label, new value) interactions, each causing one rerun"""
+    steps = []
+    # Most sessions start on the usual path before wandering
+    path = SECTIONS[:3] if rng.random() < 0.7 else []
+    while len(steps) < length:
+        section = path.pop(0) if path else rng.choice(SECTIONS)
+        steps.append((SECTION_LABEL, section))
+        widgets = choices.get(section, {})
+        for _ in range(rng.randint(0, 3) if widgets else 0):
+            label = rng.choice(sorted(widgets))
+            steps.append((label, rng.choice(widgets[label])))
+        if section == "💎 Hidden Gems" and rng.random() < 0.6:
+            # A drag reruns the script at each position the slider is released on
+            upper = 10.0
+            for _ in range(rng.randint(2, 5)):
+                upper = round(max(1.0, upper - rng.uniform(0.5, 2.0)), 1)
+                steps.append((SLIDER_LABEL, (0.0, upper)))
+        if rng.random() < 0.15:
+            steps.append((SEARCH_LABEL, rng.choice(SEARCH_TERMS)))
+    return steps
+
+def rss_mb(pid='self'):
+    """Current resident set size of a process in MiB, read from /proc"""
+    try:
+        with open(f'/proc/{pid}/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        return float('nan')
+
+def summarize(users, latencies, errors, wall, memory_mb):
+    """Percentiles, throughput and memory for one concurrency level"""
+    latency_ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(latency_ms, [50, 95, 99]) if len(latency_ms) else (np.nan,) * 3
+    return {
+        'users': users,
+        'reruns': len(latencies),
+        'errors': len(errors),
+        'throughput': len(latencies) / wall,
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99),
+        'memory_mb': memory_mb,
+        'sample_errors': errors[:3],
+    }
+
+# Live server: one websocket session per virtual user
+
+class ServerSession:
+    """A browser-like session on a running Streamlit server"""
+
+    def __init__(self, url, timeout):
+        parsed = urllib.parse.urlparse(url)
+        scheme = 'wss' if parsed.scheme == 'https' else 'ws'
+        self.stream_url = f"{scheme}://{parsed.netloc}{parsed.path.rstrip('/')}/_stcore/stream"
+        self.timeout = timeout
+        self.widgets = {}   # label -> (element type, widget id) from the latest run
+        self.values = {}    # widget id -> WidgetState of values set so far
+
+    async def __aenter__(self):
+        import websockets
+        self.socket = await websockets.connect(self.stream_url, subprotocols=["streamlit"], max_size=None)
+        await self.rerun()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.socket.close()
+
+    async def rerun(self):
+        """Send the current widget states and wait for the script run to finish"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        live_ids = {widget_id for _, widget_id in self.widgets.values()}
+        for widget_id, state in self.values.items():
+            if widget_id in live_ids:
+                message.rerun_script.widget_states.widgets.add().CopyFrom(state)
+        await self.socket.send(message.SerializeToString())
+
+        widgets, failure = {}, None
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(await asyncio.wait_for(self.socket.recv(), self.timeout))
+            kind = reply.WhichOneof('type')
+            if kind == 'delta' and reply.delta.WhichOneof('type') == 'new_element':
+                element_type = reply.delta.new_element.WhichOneof('type')
+                element = getattr(reply.delta.new_element, element_type)
+                if element_type == 'exception':
+                    failure = f"{element.type}: {element.message}"
+                elif hasattr(element, 'id') and hasattr(element, 'label'):
+                    widgets[element.label] = (element_type, element.id)
+            elif kind == 'script_finished':
+                break
+        self.widgets = widgets
+        if failure:
+            raise RuntimeError(failure)
+
+    async def perform(self, label, value):
+        """Set one widget as a user would and wait for the resulting rerun"""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        if label not in self.widgets:
+            raise LookupError(f"No widget labelled {label!r}")
+        _, widget_id = self.widgets[label]
+        state = WidgetState(id=widget_id)
+        if isinstance(value, tuple):
+            state.double_array_value.data.extend(value)
+        else:
+            state.string_value = value
+        self.values[widget_id] = state
+        await self.rerun()
+
+async def _server_level(url, users, sessions, choices, seed, timeout):
+    latencies, errors = [], []
+
+    async def virtual_user(user_id):
+        rng = random.Random(seed * 1000 + user_id)
+        async with ServerSession(url, timeout) as session:
+            for _ in range(sessions):
+                for label, value in generate_session(rng, choices):
+                    started = time.perf_counter()
+                    try:
+                        await session.perform(label, value)
+                    except (RuntimeError, LookupError, asyncio.TimeoutError) as error:
+                        errors.append(str(error))
+                        continue
+                    latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(user_id) for user_id in range(users)))
+    return latencies, errors, time.perf_counter() - started
+
+def run_server_level(url, users, sessions, choices, seed, timeout, server_pid=None):
+    """Run `users` concurrent websocket sessions against a Streamlit server"""
+    latencies, errors, wall = asyncio.run(_server_level(url, users, sessions, choices, seed, timeout))
+    return summarize(users, latencies, errors, wall, rss_mb(server_pid) if server_pid else float('nan'))
+
+def launch_server(port):
+    """Start `streamlit run Anexome.py` headless and wait until it is healthy"""
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP_PATH, '--server.headless', 'true',
+         '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError(f"Streamlit did not start on port {port} within {SERVER_START_TIMEOUT}s")
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+# AppTest: the script logic without a server, one process per virtual user
+
+def _apptest_user(user_id, sessions, choices, seed, timeout):
+    """Replay one user's sessions through AppTest; returns (latencies, errors, peak RSS MiB)"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    app.run()
+    rng = random.Random(seed * 1000 + user_id)
+    latencies, errors = [], []
+    for _ in range(sessions):
+        for label, value in generate_session(rng, choices):
+            started = time.perf_counter()
+            try:
+                widgets = [widget for elements in (app.selectbox, app.slider, app.text_input)
+                           for widget in elements if widget.label == label]
+                if not widgets:
+                    raise LookupError(f"No widget labelled {label!r}")
+                widgets[0].set_value(value).run()
+                if app.exception:
+                    raise RuntimeError(app.exception[0].message)
+            except (RuntimeError, LookupError) as error:
+                errors.append(str(error))
+                continue
+            latencies.append(time.perf_counter() - started)
+    return latencies, errors, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_apptest_level(users, sessions, choices, seed, timeout):
+    """Run `users` AppTest users in parallel processes"""
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=users) as executor:
+        results = list(executor.map(_apptest_user, range(users), [sessions] * users,
+                                    [choices] * users, [seed] * users, [timeout] * users))
+    wall = time.perf_counter() - started
+    latencies = [latency for user_latencies, _, _ in results for latency in user_latencies]
+    errors = [error for _, user_errors, _ in results for error in user_errors]
+    return summarize(users, latencies, errors, wall, sum(memory for _, _, memory in results))
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test Anexome with simulated dashboard sessions")
+    parser.add_argument('--target', choices=['server', 'apptest'], default='server')
+    parser.add_argument('--url', help="running Streamlit app to test (server target); launched locally if omitted")
+    parser.add_argument('--users', default='1,4,16', help="comma-separated concurrency levels")
+    parser.add_argument('--sessions', type=int, default=2, help="sessions replayed per virtual user")
+    parser.add_argument('--timeout', type=float, default=60, help="seconds before one rerun fails")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args()
+
+    tables = {name: loader() for name, loader in anexome_data.TABLE_LOADERS.items()}
+    choices = widget_choices(tables)
+    levels = [int(level) for level in args.users.split(',')]
+
+    server = None
+    if args.target == 'server' and not args.url:
+        port = free_port()
+        server = launch_server(port)
+        args.url = f"http://127.0.0.1:{port}"
+    memory_label = "server RSS MiB" if args.target == 'server' else "total RSS MiB"
+
+    print(f"{'users':>5} {'reruns':>7} {'errors':>6} {'reruns/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {memory_label:>15}")
+    results = []
+    try:
+        for users in levels:
+            if args.target == 'server':
+                result = run_server_level(args.url, users, args.sessions, choices, args.seed,
+                                          args.timeout, server.pid if server else None)
+            else:
+                result = run_apptest_level(users, args.sessions, choices, args.seed, args.timeout)
+            results.append(result)
+            print(f"{result['users']:>5} {result['reruns']:>7} {result['errors']:>6} "
+                  f"{result['throughput']:>8.1f} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+                  f"{result['p99_ms']:>8.1f} {result['memory_mb']:>15.0f}")
+            for error in result['sample_errors']:
+                print(f"      error: {error}")
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        with open(args.json, 'w') as results_file:
+            json.dump(results, results_file, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""Region and state scorecards kept as materialized aggregates of district data
+
+Each scorecard stores, per group, the running sums and district counts its
+columns need: totals for footfall, investment and art forms, and means for the
+infrastructure and digitization scores. When district rows are added, changed
+or removed, only the groups those rows belong to are summed again from their
+districts and only their scorecard rows are rebuilt; untouched groups are never
+regrouped.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+# District names repeat across states (Aurangabad is in Bihar and Maharashtra)
+KEY = ['State', 'District']
+LEVELS = ['Region', 'State']
+
+# Scorecard column -> how district values combine
+SCORECARD_COLUMNS = {
+    'Art_Forms_Count': 'sum',
+    'Tourist_Footfall': 'sum',
+    'Infrastructure_Score': 'mean',
+    'Digitization_Level': 'mean',
+    'Investment_Crores': 'sum',
+}
+MEAN_DECIMALS = 1
+
+COUNT = 'Districts'
+COLUMNS = list(SCORECARD_COLUMNS)
+
+def _contributions(rows, level):
+    """Per-group sums and district counts of some district rows"""
+    grouped = rows.groupby(level, sort=False)
+    sums = grouped[COLUMNS].sum()
+    sums[COUNT] = grouped.size()
+    return sums
+
+def _finalize(sums):
+    """Turn per-group sums and counts into scorecard rows"""
+    table = pd.DataFrame(index=sums.index)
+    for column, how in SCORECARD_COLUMNS.items():
+        if how == 'mean':
+            table[column] = (sums[column] / sums[COUNT]).round(MEAN_DECIMALS)
+        else:
+            table[column] = sums[column].round().astype(np.int64)
+    table[COUNT] = sums[COUNT].astype(np.int64)
+    return table
+
+def _keyed(districts):
+    """District rows indexed by their (State, District) key, after checking the table is usable"""
+    missing = [column for column in dict.fromkeys(KEY + LEVELS + COLUMNS) if column not in districts]
+    if missing:
+        raise ValueError(f"District data is missing columns: {', '.join(missing)}")
+    blank = districts[KEY + LEVELS].isna().any(axis=1)
+    if blank.any():
+        rows = districts.loc[blank, KEY].fillna('?')
+        raise ValueError("District data is missing the State, District or Region of: " + ", ".join(
+            f"{district} ({state})" for state, district in rows.itertuples(index=False)))
+    not_numeric = [column for column in COLUMNS if not pd.api.types.is_numeric_dtype(districts[column])]
+    if not_numeric:
+        raise ValueError(f"District data has non-numeric values in: {', '.join(not_numeric)}")
+    duplicated = districts.duplicated(KEY, keep=False)
+    if duplicated.any():
+        keys = districts.loc[duplicated, KEY].drop_duplicates()
+        raise ValueError("District data lists these districts more than once: " + ", ".join(
+            f"{district} ({state})" for state, district in keys.itertuples(index=False)))
+    # The key levels are unnamed so State stays unambiguous as a grouping column
+    index = pd.MultiIndex.from_frame(districts[KEY]).set_names([None, None])
+    return districts[LEVELS + COLUMNS].set_axis(index)
+
+class Scorecards:
+    """Region and state scorecards over a district table, updated incrementally
+
+    districts needs State, District, Region and the SCORECARD_COLUMNS, with one
+    row per (State, District); tables that don't fit raise ValueError before any
+    scorecard changes. Groups keep the order they first appear in.
+    """
+
+    def __init__(self, districts):
+        self._lock = threading.RLock()
+        self.districts = _keyed(districts)
+        self._sums = {level: _contributions(self.districts, level).astype(float) for level in LEVELS}
+        self._tables = {level: _finalize(self._sums[level]) for level in LEVELS}
+        self.version = 0
+
+    def table(self, level='Region'):
+        """The materialized scorecard for a level, one row per group"""
+        return self._tables[level].rename_axis(level).reset_index()
+
+    def upsert(self, rows):
+        """Add or replace district rows; returns the {level: groups} that changed"""
+        rows = _keyed(rows)
+        with self._lock:
+            return self._changed(self._upsert(rows))
+
+    def remove(self, keys):
+        """Drop district rows by (State, District) key; returns the {level: groups} that changed"""
+        with self._lock:
+            return self._changed(self._remove(list(keys)))
+
+    def refresh(self, districts):
+        """Bring the scorecards in line with a new snapshot of the whole district table
+
+        Only rows that differ from the current table (by content hash) are applied.
+        """
+        snapshot = _keyed(districts)
+        with self._lock:
+            return self._changed(self._refresh(snapshot))
+
+    def _changed(self, affected):
+        """Bump the version once per update that touched any group"""
+        if any(len(groups) for groups in affected.values()):
+            self.version += 1
+        return affected
+
+    def _upsert(self, rows):
+        existing = rows.index.intersection(self.districts.index)
+        old = self.districts.loc[existing]
+        districts = self.districts.copy()
+        districts.loc[existing] = rows.loc[existing]
+        self.districts = pd.concat([districts, rows.drop(existing)])
+        return self._apply(old, rows)
+
+    def _remove(self, keys):
+        old = self.districts[self.districts.index.isin(keys)]
+        self.districts = self.districts.drop(old.index)
+        return self._apply(old, old.iloc[:0])
+
+    def _refresh(self, snapshot):
+        current = pd.util.hash_pandas_object(self.districts)
+        incoming = pd.util.hash_pandas_object(snapshot)
+        changed = incoming[incoming.ne(current.reindex(incoming.index))].index
+        removed = current.index.difference(snapshot.index)
+        results = []
+        if len(changed):
+            results.append(self._upsert(snapshot.loc[changed]))
+        if len(removed):
+            results.append(self._remove(removed))
+        affected = {level: pd.Index([]) for level in LEVELS}
+        for result in results:
+            for level, groups in result.items():
+                affected[level] = affected[level].union(groups, sort=False)
+        return affected
+
+    def _apply(self, old, new):
+        """Recompute the sums of the groups old and new rows belong to, rebuild their scorecard rows
+
+        Sums are recomputed from the groups' current districts rather than adjusted
+        by differences, so repeated updates don't accumulate floating-point error.
+        """
+        affected = {}
+        for level in LEVELS:
+            groups = pd.Index(old[level]).append(pd.Index(new[level])).unique()
+            if groups.empty:
+                affected[level] = groups
+                continue
+            current = _contributions(self.districts[self.districts[level].isin(groups)], level).astype(float)
+            sums = self._sums[level]
+            new_groups = current.index.difference(sums.index, sort=False)
+            sums = pd.concat([sums, pd.DataFrame(0.0, index=new_groups, columns=sums.columns)])
+            sums.loc[current.index] = current[sums.columns]
+            # Groups left without districts disappear
+            self._sums[level] = sums.drop(groups.difference(current.index))
+
+            table = self._tables[level]
+            table = table.reindex(table.index.append(new_groups))
+            table.loc[current.index] = _finalize(current)
+            self._tables[level] = table.loc[self._sums[level].index].astype(self._tables[level].dtypes)
+            affected[level] = groups
+        return affected
@@ -0,0 +1,195 @@
+"""Typeahead search over art forms, hidden gems and festivals
+
+Text is normalized to a transliteration-tolerant form (Mohiniyattam and
+Mohiniattam both become "mohiniatam"), split into tokens and indexed twice:
+an inverted index from tokens to field values, and a trigram index over the
+token vocabulary for fuzzy and prefix matching. Lookups touch only the
+vocabulary, which stays small even when the tables hold millions of rows.
+"""
+import bisect
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+# Table -> (title column, searchable columns)
+SEARCH_FIELDS = {
+    'art_forms': ('Art_Form', ['Art_Form', 'State']),
+    'hidden_gems': ('Location', ['Location', 'Art_Type', 'State']),
+    'festivals': ('Festival', ['Festival', 'State']),
+}
+
+# Spelling variants common in romanized Indian names, applied in order
+TRANSLITERATION_RULES = [
+    (re.compile(r'ee'), 'i'),
+    (re.compile(r'oo'), 'u'),
+    (re.compile(r'([bcdgjkpt])h'), r'\1'),
+    (re.compile(r'sh'), 's'),
+    (re.compile(r'w'), 'v'),
+    (re.compile(r'z'), 'j'),
+    (re.compile(r'iy(?=[aeiou])'), 'i'),
+    (re.compile(r'(.)\1+'), r'\1'),
+]
+
+MIN_SIMILARITY = 0.45
+PREFIX_SCORE = 0.9
+MIN_PREFIX_LENGTH = 2
+
+def normalize(text):
+    """Lowercase, strip accents and fold transliteration variants"""
+    text = unicodedata.normalize('NFKD', str(text))
+    text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+    tokens = []
+    for token in re.findall(r'[a-z0-9]+', text):
+        for pattern, replacement in TRANSLITERATION_RULES:
+            token = pattern.sub(replacement, token)
+        tokens.append(token)
+    return tokens
+
+def trigrams(token):
+    """Padded character trigrams of a normalized token"""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _postings(lists):
+    """Pack a list of id lists into CSR form: (offsets, flat ids)"""
+    lengths = np.fromiter((len(ids) for ids in lists), dtype=np.int64, count=len(lists))
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.fromiter((i for ids in lists for i in ids), dtype=np.int32, count=int(offsets[-1]))
+    return offsets, flat
+
+def _gather(offsets, flat, ids):
+    """Concatenate the posting lists of several ids without a Python loop"""
+    ids = np.asarray(ids, dtype=np.int64)
+    starts = offsets[ids]
+    lengths = offsets[ids + 1] - starts
+    shifts = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return flat[np.arange(int(lengths.sum())) + shifts]
+
+def _best_by_id(ids, scores):
+    """Deduplicate ids, keeping the highest score of each"""
+    order = np.lexsort((-scores, ids))
+    ids, scores = ids[order], scores[order]
+    first = np.ones(len(ids), dtype=bool)
+    first[1:] = ids[1:] != ids[:-1]
+    return ids[first], scores[first]
+
+class SearchIndex:
+    """Inverted token index with trigram lookup over the token vocabulary"""
+
+    def __init__(self, documents):
+        # documents: iterable of (table, title, state, field, text); rows sharing
+        # a field value are indexed once under that value
+        value_ids = {}
+        self.values = []
+        self._value_rows = []
+        value_tokens = []
+        token_values = defaultdict(list)
+        for table, title, state, field, text in documents:
+            key = (table, field, text)
+            value_id = value_ids.get(key)
+            if value_id is None:
+                value_id = value_ids[key] = len(self.values)
+                tokens = set(normalize(text))
+                self.values.append(key)
+                self._value_rows.append([])
+                value_tokens.append(len(tokens))
+                for token in tokens:
+                    token_values[token].append(value_id)
+            self._value_rows[value_id].append((title, state))
+        self._value_tokens = np.array(value_tokens, dtype=np.float32)
+
+        self.vocabulary = sorted(token_values)
+        self._token_value_offsets, self._token_value_ids = _postings(
+            [token_values[token] for token in self.vocabulary])
+        del token_values
+
+        token_trigrams = [trigrams(token) for token in self.vocabulary]
+        self._token_trigram_counts = np.array([len(grams) for grams in token_trigrams], dtype=np.float32)
+        trigram_tokens = defaultdict(list)
+        for token_id, grams in enumerate(token_trigrams):
+            for trigram in grams:
+                trigram_tokens[trigram].append(token_id)
+        self._trigram_ids = {trigram: i for i, trigram in enumerate(trigram_tokens)}
+        self._trigram_offsets, self._trigram_token_ids = _postings(list(trigram_tokens.values()))
+
+    @classmethod
+    def from_tables(cls, tables):
+        """Index the searchable columns of whichever SEARCH_FIELDS tables are given"""
+        def documents():
+            for table, (title_column, columns) in SEARCH_FIELDS.items():
+                if table not in tables:
+                    continue
+                frame = tables[table]
+                titles = frame[title_column].tolist()
+                states = frame['State'].tolist()
+                for column in columns:
+                    for title, state, text in zip(titles, states, frame[column].tolist()):
+                        yield table, title, state, column, text
+        return cls(documents())
+
+    def _match_token(self, token, allow_prefix):
+        """Score vocabulary tokens against one query token, as (token ids, scores)"""
+        query_trigrams = trigrams(token)
+        trigram_ids = [self._trigram_ids[gram] for gram in query_trigrams if gram in self._trigram_ids]
+        token_ids, shared = np.unique(
+            _gather(self._trigram_offsets, self._trigram_token_ids, trigram_ids), return_counts=True)
+        # Dice coefficient over trigram sets
+        scores = 2 * shared / (len(query_trigrams) + self._token_trigram_counts[token_ids])
+        keep = scores >= MIN_SIMILARITY
+        token_ids, scores = token_ids[keep], scores[keep]
+
+        if allow_prefix and len(token) >= MIN_PREFIX_LENGTH:
+            start = bisect.bisect_left(self.vocabulary, token)
+            end = bisect.bisect_left(self.vocabulary, token + '\uffff')
+            token_ids = np.concatenate([token_ids, np.arange(start, end)])
+            scores = np.concatenate([scores, np.full(end - start, PREFIX_SCORE)])
+        return _best_by_id(token_ids, scores)
+
+    def search(self, query, limit=10):
+        """Return the best matching rows for a free-text query, best first"""
+        query_tokens = normalize(query)
+        if not query_tokens:
+            return []
+
+        matched_ids, matched_scores = [], []
+        for position, token in enumerate(query_tokens):
+            # Only the token being typed may match as a prefix
+            token_ids, scores = self._match_token(token, position == len(query_tokens) - 1)
+            lengths = self._token_value_offsets[token_ids + 1] - self._token_value_offsets[token_ids]
+            value_ids, value_scores = _best_by_id(
+                _gather(self._token_value_offsets, self._token_value_ids, token_ids),
+                np.repeat(scores, lengths)
+            )
+            matched_ids.append(value_ids)
+            matched_scores.append(value_scores)
+
+        candidates, inverse = np.unique(np.concatenate(matched_ids), return_inverse=True)
+        if len(candidates) == 0:
+            return []
+        totals = np.bincount(inverse, weights=np.concatenate(matched_scores))
+
+        # Mostly how much of the query matched, then a small penalty for extra words
+        query_length = len(query_tokens)
+        extra_words = query_length / np.maximum(query_length, self._value_tokens[candidates])
+        scores = totals / query_length * (0.8 + 0.2 * extra_words)
+        if len(candidates) > limit:
+            top = np.argpartition(-scores, limit)[:limit]
+            candidates, scores = candidates[top], scores[top]
+        ranked = sorted(zip(scores.tolist(), candidates.tolist()), key=lambda item: (-item[0], item[1]))
+
+        results = {}
+        for score, value_id in ranked:
+            table, field, text = self.values[value_id]
+            for title, state in self._value_rows[value_id]:
+                key = (table, title, state)
+                if key not in results:
+                    results[key] = {
+                        'table': table, 'title': title, 'state': state,
+                        'field': field, 'match': text, 'score': round(score, 3),
+                    }
+                if len(results) >= limit:
+                    return list(results.values())
+        return list(results.values())
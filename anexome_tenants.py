@@ -0,0 +1,85 @@
+"""Per-tenant overlays on the shared, read-only national dataset
+
+Each tenant (a state tourism board, say) keeps only its edits, as one CSV per
+table in <tenant directory>/<tenant>/<table>.csv with the table's columns:
+
+- a row whose key (Art_Form, Location or Festival) is new adds it,
+- a row whose key exists in the base table replaces that base row,
+- a row with Hidden set to true removes the base row with that key.
+
+Queries run against the base table as usual (so base results can be cached and
+shared by every tenant) and the overlay is merged into the result afterwards.
+"""
+import os
+import re
+
+import pandas as pd
+
+# Overlayable tables and the column identifying a row
+OVERLAY_KEYS = {
+    'art_forms': 'Art_Form',
+    'hidden_gems': 'Location',
+    'festivals': 'Festival',
+}
+
+TENANT_NAME = re.compile(r'^[a-z0-9][a-z0-9_-]*$')
+
+def valid_tenant(tenant):
+    """Whether a tenant name is safe to use as a directory name"""
+    return bool(tenant) and TENANT_NAME.match(tenant) is not None
+
+def load_overlay(directory, tenant):
+    """Read a tenant's delta tables; tables without edits are left out"""
+    if not directory or not valid_tenant(tenant):
+        return {}
+    overlay = {}
+    for table in OVERLAY_KEYS:
+        path = os.path.join(directory, tenant, f"{table}.csv")
+        if not os.path.exists(path):
+            continue
+        delta = pd.read_csv(path)
+        if 'Hidden' in delta:
+            delta['Hidden'] = delta['Hidden'].fillna(False).astype(str).str.lower().isin(['true', '1', 'yes'])
+        else:
+            delta['Hidden'] = False
+        overlay[table] = delta
+    return overlay
+
+def apply_overlay(base_result, delta, table, filter_fn, filters):
+    """Merge a tenant's delta rows into a query result computed on the base table
+
+    filter_fn(frame, **filters) is the same query that produced base_result; it
+    is re-run on the delta only. Without a delta the base result is returned as is.
+    """
+    if delta is None or delta.empty:
+        return base_result
+    key = OVERLAY_KEYS[table]
+    kept = base_result[~base_result[key].isin(delta[key])]
+    visible = _match_dtypes(delta[~delta['Hidden']].drop(columns='Hidden'), base_result.dtypes)
+    added = filter_fn(visible, **filters)
+    if added.empty:
+        return kept
+    return pd.concat([kept, added], ignore_index=True)
+
+def _match_dtypes(frame, dtypes):
+    """Cast delta columns back to the base dtypes (blank cells in Hidden rows widen ints to floats)"""
+    frame = frame.copy()
+    for column in frame.columns.intersection(dtypes.index):
+        try:
+            frame[column] = frame[column].astype(dtypes[column])
+        except (TypeError, ValueError):
+            pass
+    return frame
+
+def merge_options(base_options, delta_options):
+    """Union of the filter values offered for the base table and a delta"""
+    return {column: sorted(set(values) | set(delta_options.get(column, [])))
+            for column, values in base_options.items()}
+
+def merge_search_results(base_results, tenant_results, overlay, limit):
+    """Combine base and tenant search hits, dropping base rows the tenant replaced"""
+    replaced = {table: set(delta[OVERLAY_KEYS[table]]) for table, delta in overlay.items()}
+    results = [result for result in base_results
+               if result['title'] not in replaced.get(result['table'], ())]
+    results += tenant_results
+    return sorted(results, key=lambda result: -result['score'])[:limit]